@@ -1,23 +1,30 @@
 import pathlib
+from itertools import chain
 from typing import Sequence
 
 from tools.runnner import aoc_runner
+from tools.runnner import InputMode
 from tools.runnner import TestCases
 
 
-def part1(input_str: str) -> int:
-    digits = [c1 for c1, c2 in zip(input_str, input_str[1:] + input_str[0]) if c1 == c2]
-    return sum(int(d) for d in digits)
+ZERO = ord("0")
 
 
-def part2(input_str: str) -> int:
-    mid = int(len(input_str) / 2)
-    digits = [c1 for c1, c2 in zip(input_str[:mid], input_str[mid:] + input_str[0]) if c1 == c2]
+def part1(data: memoryview) -> int:
+    # iterating the views yields the byte values, no copies of the input are made
+    digits = [c1 for c1, c2 in zip(data, chain(data[1:], data[:1])) if c1 == c2]
+    return sum(d - ZERO for d in digits)
 
-    return sum(int(d) * 2 for d in digits)
+
+def part2(data: memoryview) -> int:
+    mid = len(data) // 2
+    digits = [c1 for c1, c2 in zip(data[:mid], data[mid:]) if c1 == c2]
+
+    return sum((d - ZERO) * 2 for d in digits)
 
 
 INPUT_FILE = pathlib.Path(__file__).parent / "input.txt"
+INPUT_MODE: InputMode = "bytes"
 
 TEST_CASES: TestCases = (
     [
@@ -37,7 +44,7 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES, input_mode=INPUT_MODE)
 
 
 if __name__ == "__main__":
@@ -14,8 +14,7 @@ def parse(input_str: str) -> list[list[int]]:
     return lines
 
 
-def part1(input_str: str) -> int:
-    lines = parse(input_str)
+def part1(lines: list[list[int]]) -> int:
     return sum(max(l) - min(l) for l in lines)
 
 
@@ -30,8 +29,8 @@ def find_val(line: list[int]):
     raise ValueError("No value found")
 
 
-def part2(input_str: str) -> int:
-    return sum(find_val(line) for line in parse(input_str))
+def part2(lines: list[list[int]]) -> int:
+    return sum(find_val(line) for line in lines)
 
 
 INPUT_FILE = pathlib.Path(__file__).parent / "input.txt"
@@ -59,7 +58,7 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES, parse=parse)
 
 
 if __name__ == "__main__":
@@ -91,7 +91,6 @@ def part2(input_str: str) -> int:
 
     position = origin
 
-    i = 0
     move_count = 0
     steps = 0
     steps_to_move = 1
@@ -105,9 +104,6 @@ def part2(input_str: str) -> int:
         if largest > target:
             return largest
 
-        if i >= 1000:
-            return -1
-
         steps += 1
         move = moves[current_move]
         position = (position[0] + move[0], position[1] + move[1])
@@ -128,8 +124,6 @@ def part2(input_str: str) -> int:
                 steps_to_move += 1
                 move_count = 0
 
-        i += 1
-
 
 INPUT_FILE = pathlib.Path(__file__).parent / "input.txt"
 
@@ -2,12 +2,12 @@ import pathlib
 from typing import Sequence
 
 from tools.runnner import aoc_runner
+from tools.runnner import InputMode
 from tools.runnner import TestCases
+from tools.stream import Lines
 
 
-def part1(input_str: str) -> int:
-    lines = input_str.strip().split("\n")
-
+def part1(lines: Lines) -> int:
     return sum(1 for line in lines if len(line.split()) == len(set(line.split())))
 
 
@@ -21,11 +21,12 @@ def check_valid(line: str) -> bool:
     return True
 
 
-def part2(input_str: str) -> int:
-    return sum(check_valid(line) for line in input_str.strip().split("\n"))
+def part2(lines: Lines) -> int:
+    return sum(check_valid(line) for line in lines)
 
 
 INPUT_FILE = pathlib.Path(__file__).parent / "input.txt"
+INPUT_MODE: InputMode = "lines"
 
 TEST_DATA = """\
 aa bb cc dd ee
@@ -52,7 +53,7 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES, input_mode=INPUT_MODE)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@ import pathlib
 from typing import Sequence
 
 from tools.runnner import aoc_runner
+from tools.runnner import Budget
 from tools.runnner import TestCases
 
 
@@ -28,10 +29,6 @@ def part2(input_str: str) -> int:
     current = 0
 
     while 0 <= current < len(instructions):
-        if steps >= 50_000_000:
-            print("LOOP OVERFLOW")
-            raise StopIteration()
-
         instruction = instructions[current]
 
         if instruction >= 3:
@@ -50,6 +47,9 @@ def part2(input_str: str) -> int:
 
 INPUT_FILE = pathlib.Path(__file__).parent / "input.txt"
 
+# part 2 takes tens of millions of steps
+BUDGET = Budget(time=300.0)
+
 TEST_DATA = """\
 0
 3
@@ -69,7 +69,7 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES, budget=BUDGET)
 
 
 if __name__ == "__main__":
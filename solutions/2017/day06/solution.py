@@ -18,10 +18,6 @@ def part1(input_str: str) -> int:
     while stringify(numbers) not in states:
         states.add(stringify(numbers))
 
-        if steps >= 1_000_000:
-            print("STEP OVERFLOW")
-            raise StopIteration()
-
         states.add(stringify(numbers))
 
         m = max(numbers)
@@ -49,10 +45,6 @@ def part2(input_str: str) -> int:
     while num_string not in states:
         states[num_string] = steps
 
-        if steps >= 1_000_000:
-            print("STEP OVERFLOW")
-            raise StopIteration()
-
         m = max(numbers)
         idxmax = numbers.index(m)
 
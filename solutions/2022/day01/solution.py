@@ -1,27 +1,29 @@
+import heapq
 import pathlib
 from typing import Iterator
 from typing import Sequence
 
 from tools.runnner import aoc_runner
+from tools.runnner import InputMode
 from tools.runnner import TestCases
+from tools.stream import Records
 
 
-def parse_elves(input_str: str) -> Iterator[list[int]]:
-    for elf in input_str.split("\n\n"):
-        yield [int(s) for s in elf.splitlines() if s.isdigit()]
+def calories(elves: Records) -> Iterator[int]:
+    for elf in elves:
+        yield sum(int(s) for s in elf if s.isdigit())
 
 
-def part1(input_str: str) -> int:
-    scores = [sum(elf) for elf in parse_elves(input_str)]
-    return max(scores)
+def part1(elves: Records) -> int:
+    return max(calories(elves))
 
 
-def part2(input_str: str) -> int:
-    scores = [sum(elf) for elf in parse_elves(input_str)]
-    return sum(c for c in sorted(scores)[-3:])
+def part2(elves: Records) -> int:
+    return sum(heapq.nlargest(3, calories(elves)))
 
 
 INPUT_FILE = pathlib.Path(__file__).parent / "input.txt"
+INPUT_MODE: InputMode = "records"
 
 TEST_DATA = """\
 1000
@@ -51,7 +53,7 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES, input_mode=INPUT_MODE)
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ from tools.runnner import aoc_runner
 from tools.runnner import TestCases
 
 
-def parse(input_str: str):
+def parse(input_str: str) -> tuple[list[int], list[int]]:
     left, right = [], []
 
     for line in input_str.splitlines():
@@ -17,8 +17,8 @@ def parse(input_str: str):
     return left, right
 
 
-def part1(input_str: str) -> int:
-    left, right = parse(input_str)
+def part1(lists: tuple[list[int], list[int]]) -> int:
+    left, right = lists
 
     left_s = sorted(left)
     right_s = sorted(right)
@@ -26,8 +26,8 @@ def part1(input_str: str) -> int:
     return sum(abs(l - r) for l, r in zip(left_s, right_s))
 
 
-def part2(input_str: str) -> int:
-    left, right = parse(input_str)
+def part2(lists: tuple[list[int], list[int]]) -> int:
+    left, right = lists
     right_counts = Counter(right)
 
     return sum(l * right_counts[l] for l in left)
@@ -55,7 +55,7 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES, parse=parse)
 
 
 if __name__ == "__main__":
@@ -2,11 +2,13 @@ import pathlib
 from typing import Sequence
 
 from tools.runnner import aoc_runner
+from tools.runnner import InputMode
 from tools.runnner import TestCases
+from tools.stream import Lines
 
 
-def parse(input_str: str) -> list[list[int]]:
-    return [[int(x) for x in line.split()] for line in input_str.splitlines()]
+def parse_line(line: str) -> list[int]:
+    return [int(x) for x in line.split()]
 
 
 def sign(x: int) -> int:
@@ -29,16 +31,13 @@ def run_line(line: list[int]) -> int:
     return 0
 
 
-def part1(input_str: str) -> int:
-    lines = parse(input_str)
-    return sum(run_line(line) for line in lines)
+def part1(lines: Lines) -> int:
+    return sum(run_line(line) for line in map(parse_line, lines))
 
 
-def part2(input_str: str) -> int:
-    lines = parse(input_str)
-
+def part2(lines: Lines) -> int:
     tot = 0
-    for line in lines:
+    for line in map(parse_line, lines):
         if run_line(line):
             tot += 1
             continue
@@ -52,6 +51,7 @@ def part2(input_str: str) -> int:
 
 
 INPUT_FILE = pathlib.Path(__file__).parent / "input.txt"
+INPUT_MODE: InputMode = "lines"
 
 TEST_DATA = """\
 7 6 4 2 1
@@ -73,7 +73,7 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES, input_mode=INPUT_MODE)
 
 
 if __name__ == "__main__":
@@ -4,14 +4,15 @@ from typing import Iterator
 from typing import Sequence
 
 from tools.runnner import aoc_runner
+from tools.runnner import InputMode
 from tools.runnner import TestCases
 
 
-regex = re.compile(r"mul\((\d+),(\d+)\)")
+regex = re.compile(rb"mul\((\d+),(\d+)\)")
 
 
-def part1(input_str: str) -> int:
-    findall = regex.findall(input_str)
+def part1(data: memoryview) -> int:
+    findall = regex.findall(data)
     return sum(int(a) * int(b) for a, b in findall)
 
 
@@ -42,30 +43,30 @@ def part1(input_str: str) -> int:
 #     return tot
 
 
-do_dont_regex = re.compile(r"do\(\)|don't\(\)")
+do_dont_regex = re.compile(rb"do\(\)|don't\(\)")
 
 
-def get_products(input_str: str) -> Iterator[tuple[str, int, int]]:
-    for m in regex.finditer(input_str):
+def get_products(data: memoryview) -> Iterator[tuple[str, int, int]]:
+    for m in regex.finditer(data):
         a = int(m.group(1))
         b = int(m.group(2))
         yield "product", m.start(), a * b
 
 
-def get_toggles(input_str: str) -> Iterator[tuple[str, int, bool]]:
-    for m in do_dont_regex.finditer(input_str):
-        yield "toggle", m.start(), m.group() == "do()"
+def get_toggles(data: memoryview) -> Iterator[tuple[str, int, bool]]:
+    for m in do_dont_regex.finditer(data):
+        yield "toggle", m.start(), m.group() == b"do()"
 
 
-def part2(input_str: str) -> int:
+def part2(data: memoryview) -> int:
     """
     Benchmark with `hyperfine` ::
 
         Time (mean ± σ):     369.3 ms ±  15.9 ms    [User: 300.4 ms, System: 59.0 ms]
         Range (min … max):   341.5 ms … 396.0 ms    10 runs
     """
-    products = list(get_products(input_str))
-    toggles = list(get_toggles(input_str))
+    products = list(get_products(data))
+    toggles = list(get_toggles(data))
 
     total = 0
     toggle = True
@@ -80,6 +81,7 @@ def part2(input_str: str) -> int:
 
 
 INPUT_FILE = pathlib.Path(__file__).parent / "input.txt"
+INPUT_MODE: InputMode = "bytes"
 
 TEST_DATA = """\
 xmul(2,4)%&mul[3,7]!@^do_not_mul(5,5)+mul(32,64]then(mul(11,8)mul(8,5))
@@ -100,7 +102,7 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES, input_mode=INPUT_MODE)
 
 
 if __name__ == "__main__":
@@ -1,77 +1,44 @@
 import pathlib
-from collections import defaultdict
+from collections import Counter
 from typing import Sequence
 
+from tools.grid import Grid
 from tools.runnner import aoc_runner
+from tools.runnner import InputMode
 from tools.runnner import TestCases
 
 
-ADJACENT = [
-    (1, 0),  # right
-    (1, 1),  # up right
-    (0, 1),  # up
-    (-1, 1),  # up left
-    (-1, 0),  # left
-    (-1, -1),  # down left
-    (0, -1),  # down
-    (1, -1),  # down right
-]
+X, M, A, S = b"XMAS"
 
-DIAGS = [
-    (1, 1),  # up right
-    (-1, 1),  # up left
-    (-1, -1),  # down left
-    (1, -1),  # down right
-]
+INPUT_MODE: InputMode = "bytes"
 
 
-def parse_grid(input_str: str) -> dict[tuple[int, int], str]:
-    grid = defaultdict(str)
+def parse(data: memoryview) -> Grid:
+    # XMAS reaches 3 cells out, the border saves bounds checking each of them
+    return Grid.parse(data, border=".", pad=3)
 
-    for y, line in enumerate(input_str.splitlines()):
-        for x, c in enumerate(line):
-            grid[(x, y)] = c
-
-    return grid
-
-
-def part1(input_str: str) -> int:
-    grid = parse_grid(input_str)
 
+def part1(grid: Grid) -> int:
+    cells = grid.cells
     tot = 0
-    xs = [k for k, v in grid.items() if v == "X"]
-
-    for x, y in xs:
-        for dx, dy in ADJACENT:
-            if grid[(x + dx, y + dy)] != "M":
-                continue
-
-            if grid[x + dx * 2, y + dy * 2] != "A":
-                continue
 
-            if grid[x + dx * 3, y + dy * 3] != "S":
-                continue
-
-            tot += 1
+    for i in grid.find_all(X):
+        for d in grid.offsets8:
+            if cells[i + d] == M and cells[i + 2 * d] == A and cells[i + 3 * d] == S:
+                tot += 1
 
     return tot
 
 
-def part2(input_str: str) -> int:
-    grid = parse_grid(input_str)
-
-    ms = [k for k, v in grid.items() if v == "M"]
-    a_pts = defaultdict(int)
-
-    for x, y in ms:
-        for dx, dy in DIAGS:
-            if grid[(x + dx, y + dy)] != "A":
-                continue
-
-            if grid[x + dx * 2, y + dy * 2] != "S":
-                continue
+def part2(grid: Grid) -> int:
+    cells = grid.cells
+    diagonals = [d for d in grid.offsets8 if d not in grid.offsets4]
+    a_pts: Counter[int] = Counter()
 
-            a_pts[(x + dx, y + dy)] += 1
+    for i in grid.find_all(M):
+        for d in diagonals:
+            if cells[i + d] == A and cells[i + 2 * d] == S:
+                a_pts[i + d] += 1
 
     return sum(v == 2 for v in a_pts.values())
 
@@ -113,7 +80,9 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(
+        argv, part1, part2, INPUT_FILE, TEST_CASES, parse=parse, input_mode=INPUT_MODE
+    )
 
 
 if __name__ == "__main__":
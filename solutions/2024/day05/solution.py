@@ -9,7 +9,7 @@ from tools.runnner import aoc_runner
 from tools.runnner import TestCases
 
 
-def parse(input_str):
+def parse(input_str: str) -> tuple[list[tuple[int, int]], list[list[int]]]:
     rules_str, pages_str = input_str.split("\n\n")
 
     rules = []
@@ -54,8 +54,8 @@ def compute(nodes: dict[int, Node], page: list[int]):
     return True
 
 
-def part1(input_str: str) -> int:
-    rules, pages = parse(input_str)
+def part1(parsed: tuple[list[tuple[int, int]], list[list[int]]]) -> int:
+    rules, pages = parsed
     nodes = create_nodes(rules)
     valid = [compute(nodes, page) for page in pages]
 
@@ -69,12 +69,13 @@ class Node:
     right: set[int] = field(default_factory=set)
 
 
-def part2(input_str: str) -> int:
-    rules, pages = parse(input_str)
+def part2(parsed: tuple[list[tuple[int, int]], list[list[int]]]) -> int:
+    rules, pages = parsed
     nodes = create_nodes(rules)
     valid = [compute(nodes, page) for page in pages]
 
-    new_pages = [p for p, v in zip(pages, valid) if not v]
+    # pages are sorted in place, copy them so the parsed input is left untouched
+    new_pages = [p.copy() for p, v in zip(pages, valid) if not v]
 
     for page in new_pages:
         curr = -1
@@ -138,7 +139,7 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES, parse=parse)
 
 
 if __name__ == "__main__":
@@ -1,97 +1,80 @@
 import pathlib
-from collections import defaultdict
+import random
+from typing import Iterator
 from typing import NamedTuple
 from typing import Sequence
 
+from tools.grid import Grid
 from tools.runnner import aoc_runner
+from tools.runnner import InputMode
 from tools.runnner import TestCases
 
 
-deltas = {"^": (0, -1), "<": (-1, 0), ">": (1, 0), "v": (0, 1)}
+INPUT_MODE: InputMode = "bytes"
 
-Point = tuple[int, int]
-Delta = tuple[int, int]
-Grid = dict[Point, int]
+# in the same clockwise order as the grid offsets
+HEADINGS = b"^>v<"
+OBSTACLE = ord("#")
+EMPTY = ord(".")
+EDGE = ord("~")
 
 
 class ParsedInput(NamedTuple):
     grid: Grid
-    max_x: int
-    max_y: int
-    loc: Point
-    delta: Delta
+    loc: int
+    delta: int
 
 
-def parse_grid(input_str: str) -> ParsedInput:
-    lines = input_str.splitlines()
+def parse(data: memoryview) -> ParsedInput:
+    grid = Grid.parse(data, border="~")
 
-    grid = defaultdict(int)
-    max_x = len(lines[0]) - 1
-    max_y = len(lines) - 1
+    for heading, c in enumerate(HEADINGS):
+        if (loc := grid.find(c)) != -1:
+            return ParsedInput(grid, loc, grid.offsets4[heading])
 
-    guard_loc: Point
-    guard_delta: Delta
+    raise ValueError("No guard in the grid")
 
-    for y, line in enumerate(lines):
-        for x, c in enumerate(line):
-            if c == ".":
-                continue
 
-            if delta := deltas.get(c):
-                guard_loc = (x, y)
-                guard_delta = delta
+def rotate(grid: Grid, delta: int) -> int:
+    offsets = grid.offsets4
+    return offsets[(offsets.index(delta) + 1) % 4]
 
-                continue
 
-            grid[(x, y)] = 1
+def move(loc: int, delta: int, grid: Grid, block: int = -1) -> tuple[int, int]:
+    next_loc = loc + delta
 
-    return ParsedInput(grid, max_x, max_y, guard_loc, guard_delta)
-
-
-def rotate(x, y):
-    m = [[0, -1], [1, 0]]
-
-    new_x = m[0][0] * x + m[0][1] * y
-    new_y = m[1][0] * x + m[1][1] * y
-
-    return new_x, new_y
-
-
-def move(loc: Point, delta: Delta, grid: Grid, block: Point = (-1, -1)) -> tuple[Point, Delta]:
-    next_loc: Point = loc[0] + delta[0], loc[1] + delta[1]
-
-    if grid[next_loc] == 1 or next_loc == block:
-        return loc, rotate(*delta)
+    if grid[next_loc] == OBSTACLE or next_loc == block:
+        return loc, rotate(grid, delta)
     else:
         return next_loc, delta
 
 
-def in_grid(loc: Point, max_x, max_y, min_x=0, min_y=0) -> bool:
-    return min_x <= loc[0] <= max_x and min_y <= loc[1] <= max_y
+def in_grid(loc: int, grid: Grid) -> bool:
+    return grid[loc] != EDGE
 
 
-def part1(input_str: str) -> int:
-    grid, mx, my, loc, delta = parse_grid(input_str)
+def part1(parsed: ParsedInput) -> int:
+    grid, loc, delta = parsed
 
     moves = set()
 
-    while in_grid(loc, mx, my):
+    while in_grid(loc, grid):
         moves.add(loc)
         loc, delta = move(loc, delta, grid)
 
     return len(moves)
 
 
-def part2(input_str: str) -> int:
-    grid, mx, my, loc, delta = parse_grid(input_str)
+def part2(parsed: ParsedInput) -> int:
+    grid, loc, delta = parsed
 
     starting_loc = loc
     starting_delta = delta
 
-    obstructions = set(grid.keys())
+    obstructions = set(grid.find_all(OBSTACLE))
 
-    moves: set[Point] = set()
-    while in_grid(loc, mx, my):
+    moves: set[int] = set()
+    while in_grid(loc, grid):
         moves.add(loc)
         loc, delta = move(loc, delta, grid)
 
@@ -104,22 +87,54 @@ def part2(input_str: str) -> int:
 
         visited = set()
 
-        for _ in range(10_000):
-            if not in_grid(loc, mx, my):
-                break
-
+        while in_grid(loc, grid):
             visited.add((loc, delta))
             loc, delta = move(loc, delta, grid, block)
 
             if (loc, delta) in visited:
                 tot_loops += 1
                 break
-        else:
-            print("Max iterations reached")
 
     return tot_loops
 
 
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    # a `scale` x `scale` grid with obstacles on 5% of it, like the real input
+    size = max(scale, 2)
+    cells = rng.sample(range(size * size), size * size // 20 + 1)
+    y, x = divmod(cells.pop(), size)
+
+    rows = bytearray(b"." * size * size)
+    for cell in cells:
+        rows[cell] = OBSTACLE
+    rows[y * size + x] = HEADINGS[0]
+
+    grid = Grid.parse(b"\n".join(rows[i : i + size] for i in range(0, size * size, size)), "~")
+    start = grid.index(x, y)
+
+    # the guard has to leave the grid, break any loop at the last obstacle it turned at
+    while True:
+        loc, delta = start, grid.offsets4[0]
+        visited = set()
+        turned_at = -1
+
+        while in_grid(loc, grid) and (loc, delta) not in visited:
+            visited.add((loc, delta))
+            next_loc, next_delta = move(loc, delta, grid)
+            if next_loc == loc:
+                turned_at = loc + delta
+
+            loc, delta = next_loc, next_delta
+
+        if not in_grid(loc, grid):
+            break
+
+        grid[turned_at] = EMPTY
+
+    for row in str(grid).splitlines():
+        yield row + "\n"
+
+
 INPUT_FILE = pathlib.Path(__file__).parent / "input.txt"
 
 TEST_DATA = """\
@@ -146,7 +161,9 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(
+        argv, part1, part2, INPUT_FILE, TEST_CASES, parse=parse, input_mode=INPUT_MODE
+    )
 
 
 if __name__ == "__main__":
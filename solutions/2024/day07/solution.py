@@ -1,16 +1,21 @@
 import pathlib
+import random
 from itertools import product
 from typing import Iterator
 from typing import Sequence
 
 from tools.runnner import aoc_runner
+from tools.runnner import InputMode
 from tools.runnner import TestCases
+from tools.stream import Lines
 
 
-def parse(input_str: str) -> Iterator[tuple[int, list[int]]]:
-    for line in input_str.splitlines():
-        res, nums = line.split(": ")
-        yield int(res.strip()), [int(n) for n in nums.strip().split()]
+Equation = tuple[int, list[int]]
+
+
+def parse_equation(line: str) -> Equation:
+    res, nums = line.split(": ")
+    return int(res.strip()), [int(n) for n in nums.strip().split()]
 
 
 def brute1(res: int, nums: list[int]) -> bool:
@@ -35,8 +40,8 @@ def brute1(res: int, nums: list[int]) -> bool:
     return 0
 
 
-def part1(input_str: str) -> int:
-    return sum(brute1(*parsed) for parsed in parse(input_str))
+def part1(lines: Lines) -> int:
+    return sum(brute1(*equation) for equation in map(parse_equation, lines))
 
 
 def brute2(res: int, nums: list[int]) -> bool:
@@ -64,11 +69,34 @@ def brute2(res: int, nums: list[int]) -> bool:
     return 0
 
 
-def part2(input_str: str) -> int:
-    return sum(brute2(*parsed) for parsed in parse(input_str))
+def part2(lines: Lines) -> int:
+    return sum(brute2(*equation) for equation in map(parse_equation, lines))
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    # `scale` equations of 2 to 6 numbers, most of them solvable. Real equations go up to 12
+    # numbers, but at 3¹¹ operator choices each not even the default --start of 100 would finish
+    for _ in range(scale):
+        nums = [rng.randint(1, 99) for _ in range(rng.randint(2, 6))]
+
+        res = nums[0]
+        for n in nums[1:]:
+            op = rng.choice("*+|")
+            if op == "*":
+                res *= n
+            elif op == "+":
+                res += n
+            else:
+                res = int(f"{res}{n}")
+
+        if rng.random() < 0.3:
+            res += 1
+
+        yield f"{res}: {' '.join(map(str, nums))}\n"
 
 
 INPUT_FILE = pathlib.Path(__file__).parent / "input.txt"
+INPUT_MODE: InputMode = "lines"
 
 TEST_DATA = """\
 190: 10 19
@@ -94,7 +122,7 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES, input_mode=INPUT_MODE)
 
 
 if __name__ == "__main__":
@@ -1,103 +1,66 @@
 import pathlib
-from collections import defaultdict
 from itertools import combinations
-from typing import NamedTuple
+from typing import Iterator
 from typing import Sequence
 
+from tools.common import Point
+from tools.grid import Grid
 from tools.runnner import aoc_runner
+from tools.runnner import InputMode
 from tools.runnner import TestCases
 
 
-Point = tuple[int, int]
-Grid = dict[Point, str]
+INPUT_MODE: InputMode = "bytes"
 
+EMPTY = ord(".")
 
-class ParsedInput(NamedTuple):
-    grid: Grid
-    max_x: int
-    max_y: int
 
+def parse(data: memoryview) -> Grid:
+    return Grid.parse(data)
 
-def parse_grid(input_str: str) -> ParsedInput:
-    lines = input_str.splitlines()
 
-    grid = defaultdict(str)
+def antennas(grid: Grid) -> Iterator[list[Point]]:
+    """The location of every antenna, grouped by frequency."""
+    for frequency in set(grid.cells) - {EMPTY}:
+        yield [grid.point(i) for i in grid.find_all(frequency)]
 
-    max_x = len(lines[0])
-    max_y = len(lines)
-
-    for y, line in enumerate(lines):
-        for x, c in enumerate(line):
-            if c == ".":
-                continue
-
-            grid[(x, y)] = c
-
-    return ParsedInput(grid, max_x, max_y)
-
-
-def draw_grid(grid: Grid, max_x: int, max_y: int, nodes: set[Point]) -> None:
-    out = ""
-    for y in range(max_y):
-        for x in range(max_x):
-            if (x, y) in nodes:
-                out += "#"
-            else:
-                out += grid.get((x, y), ".")
-
-        out += "\n"
-
-    print(out)
-
-
-def part1(input_str: str) -> int:
-    grid, max_x, max_y = parse_grid(input_str)
 
+def part1(grid: Grid) -> int:
     pos = set()
-    nodes = set(grid.values())
 
-    for node in nodes:
-        points = {k for k, v in grid.items() if v == node}
+    for points in antennas(grid):
         for p1, p2 in combinations(points, 2):
-            p1, p2 = sorted([p1, p2], key=lambda x: x[0])
-
             dx = p2[0] - p1[0]
             dy = p2[1] - p1[1]
 
             new1 = p1[0] - dx, p1[1] - dy
             new2 = p2[0] + dx, p2[1] + dy
 
-            if 0 <= new1[0] < max_x and 0 <= new1[1] < max_y:
+            if grid.contains(*new1):
                 pos.add(new1)
 
-            if 0 <= new2[0] < max_x and 0 <= new2[1] < max_y:
+            if grid.contains(*new2):
                 pos.add(new2)
 
     return len(pos)
 
 
-def part2(input_str: str) -> int:
-    grid, max_x, max_y = parse_grid(input_str)
-
+def part2(grid: Grid) -> int:
     pos = set()
-    nodes = set(grid.values())
 
-    for node in nodes:
-        points = {k for k, v in grid.items() if v == node}
+    for points in antennas(grid):
         for p1, p2 in combinations(points, 2):
-            p1, p2 = sorted([p1, p2], key=lambda x: x[0])
-
             dx = p2[0] - p1[0]
             dy = p2[1] - p1[1]
 
-            new1 = p1[0], p1[1]
-            new2 = p2[0], p2[1]
+            new1 = p1
+            new2 = p2
 
-            while 0 <= new1[0] < max_x and 0 <= new1[1] < max_y:
+            while grid.contains(*new1):
                 pos.add(new1)
                 new1 = new1[0] - dx, new1[1] - dy
 
-            while 0 <= new2[0] < max_x and 0 <= new2[1] < max_y:
+            while grid.contains(*new2):
                 pos.add(new2)
                 new2 = new2[0] + dx, new2[1] + dy
 
@@ -132,7 +95,9 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(
+        argv, part1, part2, INPUT_FILE, TEST_CASES, parse=parse, input_mode=INPUT_MODE
+    )
 
 
 if __name__ == "__main__":
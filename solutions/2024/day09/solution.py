@@ -1,12 +1,18 @@
 import pathlib
+import random
+from typing import Iterator
 from typing import Sequence
 
 from tools.runnner import aoc_runner
+from tools.runnner import InputMode
 from tools.runnner import TestCases
 
 
-def parse(input_str: str) -> tuple:
-    ints = list(map(int, input_str.strip()))
+FROM_ASCII = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+def parse(data: memoryview) -> tuple:
+    ints = data.tobytes().translate(FROM_ASCII)
 
     file_locs = {}
     file_sizes = {}
@@ -36,8 +42,8 @@ def parse(input_str: str) -> tuple:
     return disk, file_locs, file_sizes, free, max_idx
 
 
-def part1(input_str: str) -> int:
-    disk, *_ = parse(input_str)
+def part1(parsed: tuple) -> int:
+    disk = parsed[0].copy()
     emptys = list(reversed([i for i, v in enumerate(disk) if v is None]))
 
     # loop backwards through disk
@@ -69,8 +75,9 @@ def part1(input_str: str) -> int:
     return sum(i * (v or 0) for i, v in enumerate(disk))
 
 
-def part2(input_str: str) -> int:
-    disk, file_locs, file_sizes, free, max_idx = parse(input_str)
+def part2(parsed: tuple) -> int:
+    disk, file_locs, file_sizes, free, max_idx = parsed
+    disk, free = disk.copy(), free.copy()
     moved = set()
     rounds_no_moves = 0  # number of rounds with no moves - if this gets too high, break
 
@@ -153,7 +160,23 @@ def check_file_locs(disk: list[int | None], file_sizes: dict[int, int]) -> None:
         i += file_size
 
 
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    # `scale` files, each after a gap of free space
+    for start in range(0, scale, 4096):
+        digits = []
+        for i in range(start, min(start + 4096, scale)):
+            if i:
+                digits.append(rng.choice("0123456789"))
+
+            digits.append(rng.choice("123456789"))
+
+        yield "".join(digits)
+
+    yield "\n"
+
+
 INPUT_FILE = pathlib.Path(__file__).parent / "input.txt"
+INPUT_MODE: InputMode = "bytes"
 
 TEST_DATA = """\
 2333133121414131402
@@ -170,7 +193,9 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(
+        argv, part1, part2, INPUT_FILE, TEST_CASES, parse=parse, input_mode=INPUT_MODE
+    )
 
 
 if __name__ == "__main__":
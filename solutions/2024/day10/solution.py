@@ -1,133 +1,82 @@
 import pathlib
-from collections import defaultdict
-from typing import NamedTuple
+import random
+from typing import Iterator
 from typing import Sequence
 
+from tools.grid import Grid
 from tools.runnner import aoc_runner
+from tools.runnner import InputMode
 from tools.runnner import TestCases
 
 
-Point = tuple[int, int]
-Grid = dict[Point, int]
+INPUT_MODE: InputMode = "bytes"
 
+# heights stay ascii digits, the "." border is never one more than a height
+TRAIL_HEAD = ord("0")
+PEAK = ord("9")
 
-class ParsedInput(NamedTuple):
-    grid: Grid
-    max_x: int
-    max_y: int
 
+def parse(data: memoryview) -> Grid:
+    return Grid.parse(data, border=".")
 
-def parse_grid(input_str: str) -> ParsedInput:
-    lines = input_str.splitlines()
 
-    grid = defaultdict(lambda: -1)
-
-    max_x = len(lines[0])
-    max_y = len(lines)
-
-    for y, line in enumerate(lines):
-        for x, c in enumerate(line):
-            if c == ".":
-                continue
-
-            grid[(x, y)] = int(c)
-
-    return ParsedInput(grid, max_x, max_y)
-
-
-STEPS = [
-    (0, -1),
-    (0, 1),
-    (-1, 0),
-    (1, 0),
-]
-
-
-def print_grid(grid: Grid, max_x: int, max_y: int, curr: Point) -> None:
-    for y in range(max_y):
-        for x in range(max_x):
-            if (x, y) == curr:
-                print("@", end="")
-            elif grid[(x, y)] == -1:
-                print(".", end="")
-            else:
-                print(grid[(x, y)], end="")
-        print()
-
-
-def part1(input_str: str) -> int:
-    grid, max_x, max_y = parse_grid(input_str)
-
-    trail_heads = {k for k, v in grid.items() if v == 0}
+def part1(grid: Grid) -> int:
+    cells = grid.cells
 
     tot_nines = 0
 
-    for start in trail_heads:
+    for start in grid.find_all(TRAIL_HEAD):
         nines = set()
         to_visit = {start}
 
         while to_visit:
-            x, y = to_visit.pop()
-            curr = grid[(x, y)]
+            i = to_visit.pop()
+            curr = cells[i]
 
-            if grid[(x, y)] == 9:
-                nines.add((x, y))
+            if curr == PEAK:
+                nines.add(i)
                 continue
 
-            for dx, dy in STEPS:
-                new_x, new_y = x + dx, y + dy
-
-                if new_x < 0 or new_x >= max_x or new_y < 0 or new_y >= max_y:
-                    continue
-
-                if (new_x, new_y) not in grid:
-                    continue
-
-                if grid[(new_x, new_y)] != curr + 1:
-                    continue
-
-                to_visit.add((new_x, new_y))
+            for d in grid.offsets4:
+                if cells[i + d] == curr + 1:
+                    to_visit.add(i + d)
 
         tot_nines += len(nines)
 
     return tot_nines
 
 
-def part2(input_str: str) -> int:
-    grid, max_x, max_y = parse_grid(input_str)
-
-    trail_heads = {k for k, v in grid.items() if v == 0}
+def part2(grid: Grid) -> int:
+    cells = grid.cells
 
-    paths = []
+    paths = 0
 
-    for start in trail_heads:
-        to_visit = [(start, [start])]
+    for start in grid.find_all(TRAIL_HEAD):
+        to_visit = [start]
 
         while to_visit:
-            (x, y), path = to_visit.pop()
+            i = to_visit.pop()
+            curr = cells[i]
 
-            curr = grid[(x, y)]
-
-            if grid[(x, y)] == 9:
-                paths.append(path)
+            if curr == PEAK:
+                paths += 1
                 continue
 
-            for dx, dy in STEPS:
-                new_x, new_y = x + dx, y + dy
-                new_path = path + [(new_x, new_y)]
-
-                if new_x < 0 or new_x >= max_x or new_y < 0 or new_y >= max_y:
-                    continue
+            for d in grid.offsets4:
+                if cells[i + d] == curr + 1:
+                    to_visit.append(i + d)
 
-                if (new_x, new_y) not in grid:
-                    continue
+    return paths
 
-                if grid[(new_x, new_y)] != curr + 1:
-                    continue
 
-                to_visit.append(((new_x, new_y), new_path))
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    # a `scale` x `scale` map where neighbouring heights mostly differ by one
+    above = [rng.randrange(10) for _ in range(scale)]
 
-    return len(paths)
+    for _ in range(scale):
+        row = [(h + rng.choice((-1, 1))) % 10 for h in above]
+        yield "".join(map(str, row)) + "\n"
+        above = row
 
 
 INPUT_FILE = pathlib.Path(__file__).parent / "input.txt"
@@ -217,7 +166,9 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(
+        argv, part1, part2, INPUT_FILE, TEST_CASES, parse=parse, input_mode=INPUT_MODE
+    )
 
 
 if __name__ == "__main__":
@@ -28,8 +28,7 @@ def process_stone(stone: int) -> list[int]:
     return [stone * 2024]
 
 
-def part1(input_str: str) -> int:
-    stones = parse(input_str)
+def part1(stones: list[int]) -> int:
     new_stones = []
 
     for _ in range(25):
@@ -42,8 +41,7 @@ def part1(input_str: str) -> int:
     return len(stones)
 
 
-def part2(input_str: str) -> int:
-    stones = parse(input_str)
+def part2(stones: list[int]) -> int:
     current = Counter(stones)
 
     for _ in range(75):
@@ -76,7 +74,7 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES, parse=parse)
 
 
 if __name__ == "__main__":
@@ -1,35 +1,22 @@
 import pathlib
+import random
+import string
 from collections import defaultdict
-from typing import NamedTuple
+from typing import Iterator
 from typing import Sequence
 
+from tools.common import Point
+from tools.grid import Grid
 from tools.runnner import aoc_runner
+from tools.runnner import InputMode
 from tools.runnner import TestCases
 
 
-Point = tuple[int, int]
-Grid = dict[Point, int]
+INPUT_MODE: InputMode = "bytes"
 
 
-class ParsedInput(NamedTuple):
-    grid: Grid
-    max_x: int
-    max_y: int
-
-
-def parse_grid(input_str: str) -> ParsedInput:
-    lines = input_str.splitlines()
-
-    grid = defaultdict(str)
-
-    max_x = len(lines[0])
-    max_y = len(lines)
-
-    for y, line in enumerate(lines):
-        for x, c in enumerate(line):
-            grid[(x, y)] = c
-
-    return ParsedInput(grid, max_x, max_y)
+def parse(data: memoryview) -> Grid:
+    return Grid.parse(data, border=".")
 
 
 STEPS = [
@@ -40,7 +27,7 @@ STEPS = [
 ]
 
 
-def find_regions(grid: Grid, start: Point, placed: set[Point], regions: dict[str, set[str]]):
+def find_regions(grid: Grid, start: int, placed: set[int], regions: dict[str, set[Point]]) -> None:
     if start in placed:
         return
 
@@ -49,15 +36,12 @@ def find_regions(grid: Grid, start: Point, placed: set[Point], regions: dict[str
     to_visit = {start}
 
     while to_visit:
-        x, y = to_visit.pop()
-        regions[f"{plant}_{i}"].add((x, y))
-        placed.add((x, y))
+        j = to_visit.pop()
+        regions[f"{chr(plant)}_{i}"].add(grid.point(j))
+        placed.add(j)
 
-        for dx, dy in STEPS:
-            new = x + dx, y + dy
-
-            if new not in grid:
-                continue
+        for d in grid.offsets4:
+            new = j + d
 
             if grid[new] != plant:
                 continue
@@ -85,35 +69,16 @@ def perimeter(region: set[Point]) -> int:
     return 4 * len(region) - sides_touching
 
 
-def part1(input_str: str) -> int:
-    grid, mx, my = parse_grid(input_str)
-
-    placed = set()
-    regions = defaultdict(set)
+def part1(grid: Grid) -> int:
+    placed: set[int] = set()
+    regions: dict[str, set[Point]] = defaultdict(set)
 
-    for point in grid:
-        find_regions(grid, point, placed, regions)
+    for i in grid.indices():
+        find_regions(grid, i, placed, regions)
 
-    # print(regions)
-    # [print(k, area(region), perimeter(region)) for k, region in regions.items()]
     return sum(area(region) * perimeter(region) for region in regions.values())
 
 
-def print_grid(grid: Grid, curr: Point) -> None:
-    max_x = max(p[0] for p in grid.keys()) + 1
-    max_y = max(p[1] for p in grid.keys()) + 1
-
-    for y in range(max_y):
-        for x in range(max_x):
-            if (x, y) == curr:
-                print("@", end="")
-            elif grid[(x, y)] == -1:
-                print(".", end="")
-            else:
-                print(grid[(x, y)], end="")
-        print()
-
-
 def bulk_perimeter(region: set[Point]) -> int:
     min_x = min(p[0] for p in region)
     max_x = max(p[0] for p in region) + 1
@@ -186,18 +151,35 @@ def bulk_perimeter(region: set[Point]) -> int:
     return len(left) + len(right) + len(top) + len(bottom)
 
 
-def part2(input_str: str) -> int:
-    grid, mx, my = parse_grid(input_str)
-
-    placed = set()
-    regions = defaultdict(set)
+def part2(grid: Grid) -> int:
+    placed: set[int] = set()
+    regions: dict[str, set[Point]] = defaultdict(set)
 
-    for point in grid:
-        find_regions(grid, point, placed, regions)
+    for i in grid.indices():
+        find_regions(grid, i, placed, regions)
 
     return sum(area(region) * bulk_perimeter(region) for region in regions.values())
 
 
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    # a `scale` x `scale` garden, plots mostly copy a neighbour so regions grow
+    above = [rng.choice(string.ascii_uppercase) for _ in range(scale)]
+
+    for _ in range(scale):
+        row: list[str] = []
+        for x in range(scale):
+            r = rng.random()
+            if r < 0.45 and row:
+                row.append(row[-1])
+            elif r < 0.9:
+                row.append(above[x])
+            else:
+                row.append(rng.choice(string.ascii_uppercase))
+
+        yield "".join(row) + "\n"
+        above = row
+
+
 INPUT_FILE = pathlib.Path(__file__).parent / "input.txt"
 
 TEST_DATA = """\
@@ -262,7 +244,9 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(
+        argv, part1, part2, INPUT_FILE, TEST_CASES, parse=parse, input_mode=INPUT_MODE
+    )
 
 
 if __name__ == "__main__":
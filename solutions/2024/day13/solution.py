@@ -1,6 +1,5 @@
 import pathlib
 import re
-from typing import Iterator
 from typing import Sequence
 
 from tools.runnner import aoc_runner
@@ -13,18 +12,24 @@ button_regex = re.compile(r"^Button [AB]: X\+(\d+), Y\+(\d+)$")
 prize_regex = re.compile(r"^Prize: X=(\d+), Y=(\d+)$")
 
 
-def parse(input_str: str) -> Iterator[tuple[XY, XY, XY]]:
+Machine = tuple[XY, XY, XY]
+
+
+def parse(input_str: str) -> list[Machine]:
+    machines = []
     for group in input_str.split("\n\n"):
         lines = group.split("\n")
         a = tuple(int(x) for x in button_regex.match(lines[0]).groups())
         b = tuple(int(x) for x in button_regex.match(lines[1]).groups())
         target = tuple(int(x) for x in prize_regex.match(lines[2]).groups())
-        yield (a, b, target)
+        machines.append((a, b, target))
+
+    return machines
 
 
-def part1(input_str: str) -> int:
+def part1(machines: list[Machine]) -> int:
     cost = 0
-    for (x1, y1), (x2, y2), (X, Y) in parse(input_str):
+    for (x1, y1), (x2, y2), (X, Y) in machines:
         b = (Y * x1 - X * y1) / (y2 * x1 - x2 * y1)
         a = (X - b * x2) / x1
 
@@ -34,11 +39,11 @@ def part1(input_str: str) -> int:
     return cost
 
 
-def part2(input_str: str) -> int:
+def part2(machines: list[Machine]) -> int:
     ADD = 10000000000000
 
     cost = 0
-    for (x1, y1), (x2, y2), (X, Y) in parse(input_str):
+    for (x1, y1), (x2, y2), (X, Y) in machines:
         X = X + ADD
         Y = Y + ADD
 
@@ -82,7 +87,7 @@ TEST_CASES: TestCases = (
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES)
+    return aoc_runner(argv, part1, part2, INPUT_FILE, TEST_CASES, parse=parse)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,205 @@
+import contextlib
+import io
+import json
+import pathlib
+from typing import Literal
+from typing import NamedTuple
+
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+
+from tools import engine
+from tools.cache import AnswerCache
+from tools.cache import cache_key
+from tools.cache import CachedAnswer
+from tools.common import format_ns
+from tools.worker import Outcome
+from tools.worker import run_concurrently
+from tools.worker import Task
+
+TimingsFile = pathlib.Path(".run_timings.json")
+
+Status = Literal["ok", "cached", "pass", "fail", "error", "timeout", "oom", "no input"]
+
+
+class Job(NamedTuple):
+    year: int
+    day: int
+    part: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.year}/{self.day}/{self.part}"
+
+
+class JobResult(NamedTuple):
+    job: Job
+    status: Status
+    answer: str
+    elapsed_ns: int
+    # the answer as the part returned it, `answer` is only for display
+    value: int | str | None = None
+
+
+def discover_jobs(year: int | None = None) -> list[Job]:
+    jobs: list[Job] = []
+
+    for path in sorted(engine.SolutionsDir.glob("*/day*/solution.py")):
+        solution_year = int(path.parent.parent.name)
+        solution_day = int(path.parent.name.removeprefix("day"))
+
+        if year and solution_year != year:
+            continue
+
+        jobs.extend(Job(solution_year, solution_day, part) for part in (1, 2))
+
+    return jobs
+
+
+def load_timings() -> dict[str, int]:
+    if not TimingsFile.exists():
+        return {}
+
+    timings: dict[str, int] = json.loads(TimingsFile.read_text())
+    return timings
+
+
+def save_timings(results: list[JobResult]) -> None:
+    timings = load_timings()
+    for result in results:
+        if result.status in ("ok", "pass"):
+            timings[result.job.key] = result.elapsed_ns
+
+    TimingsFile.write_text(json.dumps(timings, indent=2, sort_keys=True))
+
+
+def schedule(jobs: list[Job], timings: dict[str, int]) -> list[Job]:
+    # unknown jobs go first, they could be the slowest
+    return sorted(jobs, key=lambda job: timings.get(job.key, float("inf")), reverse=True)
+
+
+def run_job(solution: engine.Solution, job: Job, test: bool = False) -> JobResult:
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            if test:
+                tests = engine.run_tests(solution, job.part, parallel=False)
+                passed = sum(tc.passed for tc in tests)
+                elapsed = sum(tc.elapsed_ns for tc in tests)
+                status: Status = "pass" if passed == len(tests) else "fail"
+                return JobResult(job, status, f"{passed}/{len(tests)}", elapsed)
+
+            # the job already runs in its own process, held to the solution's budget
+            result = engine.run_part(solution, job.part, isolate=False)
+    except engine.InputNotFound:
+        return JobResult(job, "no input", "", 0)
+
+    return JobResult(job, "ok", str(result.answer), result.elapsed_ns, result.answer)
+
+
+def load_solutions(jobs: list[Job]) -> dict[tuple[int, int], engine.Solution | str]:
+    solutions: dict[tuple[int, int], engine.Solution | str] = {}
+
+    for year, day in sorted({(job.year, job.day) for job in jobs}):
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                solutions[year, day] = engine.load_solution(year, day)
+        except Exception as e:
+            solutions[year, day] = f"{type(e).__name__}: {e}"
+
+    return solutions
+
+
+def create_batch_table(test: bool) -> Table:
+    title = "BATCH TEST RESULTS" if test else "BATCH RESULTS"
+    table = Table(title=title, min_width=80, title_justify="left")
+    table.add_column("YEAR")
+    table.add_column("DAY")
+    table.add_column("PART")
+    table.add_column("PASSED" if test else "ANSWER", style="cyan")
+    table.add_column("TIME", justify="right", style="yellow")
+    table.add_column("STATUS")
+
+    return table
+
+
+def add_batch_row(table: Table, result: JobResult) -> None:
+    status_str = {
+        "ok": "[green]OK",
+        "cached": "[green]CACHED",
+        "pass": "[green]PASS",
+        "fail": "[red]FAIL",
+        "error": "[red]ERROR",
+        "timeout": "[red]TIMEOUT",
+        "oom": "[red]OOM",
+        "no input": "[bright_black]NO INPUT",
+    }[result.status]
+
+    table.add_row(
+        str(result.job.year),
+        str(result.job.day),
+        str(result.job.part),
+        result.answer,
+        format_ns(result.elapsed_ns),
+        status_str,
+    )
+
+
+def run_batch(
+    year: int | None = None,
+    test: bool = False,
+    workers: int | None = None,
+    console: Console | None = None,
+    use_cache: bool = True,
+) -> list[JobResult]:
+    jobs = schedule(discover_jobs(year), load_timings())
+    solutions = load_solutions(jobs)
+    cache = AnswerCache.load() if use_cache and not test else None
+    table = create_batch_table(test)
+    results = []
+    keys = {}
+
+    tasks = []
+    for job in jobs:
+        solution = solutions[job.year, job.day]
+        if isinstance(solution, str):
+            results.append(JobResult(job, "error", solution, 0))
+            continue
+
+        if cache is not None and solution.input_file.exists():
+            keys[job] = cache_key(solution.part(job.part), solution.parse, solution.input_file)
+            if entry := cache.get(keys[job]):
+                results.append(JobResult(job, "cached", str(entry.answer), entry.elapsed_ns))
+                continue
+
+        budget = solution.budget
+        tasks.append((job, Task(run_job, (solution, job, test), budget.time, budget.memory)))
+
+    with Live(table, console=console, auto_refresh=False) as live:
+        for result in results:
+            add_batch_row(table, result)
+
+        def on_done(i: int, outcome: Outcome) -> None:
+            job = tasks[i][0]
+            if outcome.status == "ok":
+                result = outcome.result
+            else:
+                error = outcome.error.splitlines()[-1]
+                result = JobResult(job, outcome.status, error, outcome.elapsed_ns)
+
+            if cache is not None and result.status == "ok" and result.value is not None:
+                cache.put(keys[job], CachedAnswer(result.value, result.elapsed_ns))
+
+            results.append(result)
+            add_batch_row(table, result)
+            live.refresh()
+
+        run_concurrently([task for _, task in tasks], workers, on_done)
+
+    if cache is not None:
+        cache.save()
+
+    if not test:
+        save_timings(results)
+
+    return results
@@ -0,0 +1,88 @@
+import gc
+import math
+import statistics
+import time
+from typing import Any
+from typing import Callable
+from typing import NamedTuple
+
+from rich.table import Table
+
+from tools.common import format_ns
+
+
+class BenchStats(NamedTuple):
+    samples: list[int]
+
+    @property
+    def min(self) -> int:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples)
+
+    @property
+    def stddev(self) -> float:
+        if len(self.samples) < 2:
+            return 0.0
+
+        return statistics.stdev(self.samples)
+
+    @property
+    def p95(self) -> int:
+        ordered = sorted(self.samples)
+        rank = math.ceil(0.95 * len(ordered))
+        return ordered[max(rank, 1) - 1]
+
+
+def benchmark(
+    fn: Callable[[Any], Any],
+    input_data: Any,
+    warmup: int = 3,
+    repeat: int = 10,
+) -> BenchStats:
+    for _ in range(warmup):
+        fn(input_data)
+
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            fn(input_data)
+            samples.append(time.perf_counter_ns() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return BenchStats(samples)
+
+
+def create_bench_table(title: str = "BENCHMARK") -> Table:
+    table = Table(title=title, min_width=80, title_justify="left")
+    table.add_column("PART")
+    table.add_column("RUNS")
+    for column in ("MIN", "MEDIAN", "MEAN", "STDDEV", "P95"):
+        table.add_column(column, justify="right", style="cyan")
+
+    return table
+
+
+def add_bench_row(table: Table, label: str, stats: BenchStats) -> None:
+    table.add_row(
+        label,
+        str(len(stats.samples)),
+        format_ns(stats.min),
+        format_ns(round(stats.median)),
+        format_ns(round(stats.mean)),
+        format_ns(round(stats.stddev)),
+        format_ns(stats.p95),
+    )
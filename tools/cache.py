@@ -0,0 +1,203 @@
+import hashlib
+import inspect
+import json
+import mmap
+import pathlib
+import pickle
+import platform
+import sys
+from types import CodeType
+from typing import Any
+from typing import Iterator
+from typing import NamedTuple
+
+from tools.common import ParseFn
+from tools.common import PartFn
+from tools.history import file_hash
+
+CacheFile = pathlib.Path(".answer_cache.json")
+ParsedCacheName = "parsed.pickle"
+
+# hashing the parse source costs about a millisecond, faster parses aren't worth caching
+MIN_PARSE_NS = 5_000_000
+
+MAX_ENTRIES = 1000
+
+
+class CachedAnswer(NamedTuple):
+    answer: int | str
+    elapsed_ns: int
+    parse_ns: int = 0
+
+
+def _code_names(code: CodeType) -> Iterator[str]:
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            yield from _code_names(const)
+
+
+def _is_external(obj: Any) -> bool:
+    module = getattr(obj, "__module__", None) or "builtins"
+    return module.partition(".")[0] in sys.stdlib_module_names
+
+
+def _stable_repr(value: Any) -> str:
+    # sets and dicts of strings iterate in a different order on every run
+    if isinstance(value, dict):
+        items = sorted(f"{_stable_repr(k)}: {_stable_repr(v)}" for k, v in value.items())
+        return "{" + ", ".join(items) + "}"
+
+    if isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(sorted(_stable_repr(v) for v in value)) + "}"
+
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_stable_repr(v) for v in value) + "]"
+
+    return repr(value)
+
+
+def _source(obj: Any) -> str:
+    try:
+        return inspect.getsource(obj)
+    except (OSError, TypeError):
+        # generated code, e.g. dataclass and NamedTuple methods
+        return f"{obj.__module__}.{obj.__qualname__}"
+
+
+def _sources(obj: Any, seen: set[int]) -> Iterator[str]:
+    """The source of `obj` and of every global it references, recursively."""
+    obj = inspect.unwrap(obj) if callable(obj) else obj
+    if id(obj) in seen or inspect.ismodule(obj):
+        return
+
+    seen.add(id(obj))
+
+    if (inspect.isfunction(obj) or inspect.isclass(obj)) and _is_external(obj):
+        yield f"{obj.__module__}.{obj.__qualname__}"
+        return
+
+    if inspect.isclass(obj):
+        yield _source(obj)
+        for member in vars(obj).values():
+            member = getattr(member, "__func__", member)
+            if inspect.isfunction(member) and member.__qualname__.startswith(obj.__qualname__):
+                yield from _sources(member, seen)
+
+        return
+
+    if not inspect.isfunction(obj):
+        has_repr = not callable(obj) and type(obj).__repr__ is not object.__repr__
+        yield _stable_repr(obj) if has_repr else type(obj).__qualname__
+        return
+
+    yield _source(obj)
+    for name in _code_names(obj.__code__):
+        if name in obj.__globals__:
+            yield from _sources(obj.__globals__[name], seen)
+
+    for cell in obj.__closure__ or ():
+        yield from _sources(cell.cell_contents, seen)
+
+
+def _digest(input_file: pathlib.Path, *fns: Any) -> "hashlib._Hash":
+    h = hashlib.sha256()
+    h.update(file_hash(input_file).encode())
+    h.update(platform.python_version().encode())
+
+    seen: set[int] = set()
+    for fn in fns:
+        for source in _sources(fn, seen):
+            h.update(source.encode())
+
+    return h
+
+
+def cache_key(fn: PartFn, parse: ParseFn | None, input_file: pathlib.Path) -> str:
+    fns = (fn, parse) if parse else (fn,)
+    return _digest(input_file, *fns).hexdigest()
+
+
+def parse_key(parse: ParseFn, input_file: pathlib.Path) -> str:
+    h = _digest(input_file, parse)
+
+    # pickles refer to classes by module, which is __main__ when run through aoc_runner
+    h.update(parse.__module__.encode())
+    return h.hexdigest()
+
+
+def parsed_file(input_file: pathlib.Path) -> pathlib.Path:
+    return input_file.parent / ParsedCacheName
+
+
+def load_parsed(parse: ParseFn, input_file: pathlib.Path) -> Any | None:
+    """Load the output of `parse` saved by an earlier run, if the input and parse are unchanged."""
+    path = parsed_file(input_file)
+    if not path.exists() or not path.stat().st_size:
+        return None
+
+    key = parse_key(parse, input_file).encode()
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm[: len(key)] != key:
+            return None
+
+        with memoryview(mm) as view:
+            try:
+                return pickle.loads(view[len(key) + 1 :])
+            except Exception:
+                return None
+
+
+def discard_parsed(input_file: pathlib.Path) -> None:
+    parsed_file(input_file).unlink(missing_ok=True)
+
+
+def save_parsed(parse: ParseFn, input_file: pathlib.Path, parsed: Any) -> bool:
+    try:
+        data = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # lambdas, generators and the like
+        return False
+
+    key = parse_key(parse, input_file).encode()
+    parsed_file(input_file).write_bytes(key + b"\n" + data)
+    return True
+
+
+class AnswerCache:
+    """Answers from previous runs, evicting the least recently used past `max_entries`."""
+
+    def __init__(
+        self,
+        entries: dict[str, CachedAnswer] | None = None,
+        max_entries: int = MAX_ENTRIES,
+    ) -> None:
+        self.entries = entries or {}
+        self.max_entries = max_entries
+
+    @classmethod
+    def load(cls, path: pathlib.Path = CacheFile) -> "AnswerCache":
+        if not path.exists():
+            return cls()
+
+        entries = json.loads(path.read_text())
+        return cls({key: CachedAnswer(*value) for key, value in entries.items()})
+
+    def save(self, path: pathlib.Path = CacheFile) -> None:
+        path.write_text(json.dumps(self.entries))
+
+    def get(self, key: str) -> CachedAnswer | None:
+        if (entry := self.entries.pop(key, None)) is None:
+            return None
+
+        # dicts keep insertion order, so the most recently used entries stay at the end
+        self.entries[key] = entry
+        return entry
+
+    def put(self, key: str, entry: CachedAnswer) -> None:
+        self.entries.pop(key, None)
+        self.entries[key] = entry
+
+        while len(self.entries) > self.max_entries:
+            del self.entries[next(iter(self.entries))]
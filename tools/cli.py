@@ -1,17 +1,30 @@
 import pathlib
-import subprocess
+import threading
+import time
 from typing import Annotated
+from typing import Callable
+from typing import TYPE_CHECKING
 
 import typer
 from rich import print
 from rich.prompt import Confirm
 from rich.prompt import Prompt
 
-from tools.utils import fetch_input
+from tools.common import format_bytes
+from tools.common import format_ns
+from tools.utils import CurrentPuzzleFile
 from tools.utils import get_puzzle
 from tools.utils import Puzzle
-from tools.utils import submit_answer
-from tools.utils import try_fetch_input
+
+# commands import the tools they use themselves, so `aoc set` doesn't pay for `aoc scale`
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    import httpx
+
+    from tools.engine import RunResult
+    from tools.history import BenchRecord
+    from tools.testcases import TestResult
 
 app = typer.Typer()
 
@@ -107,11 +120,45 @@ def _read_token() -> str:
     return token_path.read_text().strip()
 
 
+def _pull_input(year: int, day: int, input_file: pathlib.Path, refresh: bool = False) -> None:
+    from tools.store import account_id
+    from tools.store import find as find_input
+    from tools.store import link_input
+    from tools.store import put as store_input
+    from tools.utils import try_fetch_input
+
+    token = _read_token()
+    account = account_id(token)
+
+    # a refresh skips the store, its copy may be the stale or truncated one being replaced
+    if not refresh and (blob := find_input(year, day, account)):
+        print(f"[bright_cyan]Linking input from [not bold underline]{blob}[/]...")
+    else:
+        blob = store_input(year, day, account, try_fetch_input(day, year, token))
+
+    link_input(blob, input_file)
+
+
 @app.command("pull")
-def pull_data(day: Day = None, year: Year = None) -> None:
+def pull_data(
+    day: Day = None,
+    year: Year = None,
+    all: Annotated[
+        bool, typer.Option("--all", help="Pull every unlocked day of the year")
+    ] = False,
+    refresh: Annotated[
+        bool, typer.Option(help="Fetch inputs that already exist or are stored again")
+    ] = False,
+) -> None:
     """Pull data for the current puzzle"""
+    from tools import engine
+
+    if all:
+        _pull_year(year or get_puzzle(Puzzle.load(), day, year).year, refresh)
+        return
+
     puzzle = get_puzzle(Puzzle.load(), day, year)
-    solution_folder = pathlib.Path(f"solutions/{year}/day{puzzle.day:02d}")
+    solution_folder = engine.solution_folder(puzzle.year, puzzle.day)
     if not solution_folder.exists():
         print(
             f"[red]Solution folder [not bold underline]{solution_folder}[/] not found!",
@@ -119,27 +166,69 @@ def pull_data(day: Day = None, year: Year = None) -> None:
         raise typer.Exit()
 
     input_file = solution_folder / "input.txt"
-    if input_file.exists() and not Confirm.ask("Do you want to overwrite it?"):
-        print("[red]Exiting.")
-        return
+    if input_file.exists():
+        if not Confirm.ask("Do you want to overwrite it?"):
+            print("[red]Exiting.")
+            return
+
+        refresh = True
 
     print(
         f"[bright_cyan]Pulling data for [bold]Day {puzzle.day}, {puzzle.year}[/bold]...",
     )
 
-    input_data = fetch_input(puzzle.day, puzzle.year, _read_token())
-    input_file.write_text(input_data)
+    _pull_input(puzzle.year, puzzle.day, input_file, refresh)
 
     print("[green]Data pulled!")
 
 
-@app.command("new")
-def new_day(day: Day = None, year: Year = None, next: Next = False) -> None:
-    """Create a new day folder and pull data."""
-    puzzle = get_puzzle(None, day, year, next=next)
-    puzzle.save()
+def _pull_year(year: int, refresh: bool) -> None:
+    from tools.download import pull_year
+
+    print(f"[bright_cyan]Pulling data for every day of [bold]{year}[/bold]...")
+
+    start = time.perf_counter_ns()
+    downloads = pull_year(year, _read_token(), refresh)
+    elapsed = time.perf_counter_ns() - start
+    print()
+
+    failed = [d for d in downloads if d.status == "failed"]
+    if failed:
+        print(f"[bold red]{len(failed)} of {len(downloads)} inputs failed!")
+        raise typer.Exit(1)
+
+    print(f"[green]Pulled {len(downloads)} inputs in {format_ns(elapsed)}!")
 
-    solution_folder = pathlib.Path(f"solutions/{puzzle.year}/day{puzzle.day:02d}")
+
+@app.command("store")
+def store_inputs() -> None:
+    """Move the inputs of this checkout into the shared input store."""
+    from tools import engine
+    from tools.history import puzzle_from_path
+    from tools.store import account_id
+    from tools.store import InputsDir
+    from tools.store import link_input
+    from tools.store import put as store_input
+
+    account = account_id(_read_token())
+    moved = 0
+
+    for input_file in sorted(engine.SolutionsDir.glob("*/day*/input.txt")):
+        if input_file.is_symlink():
+            continue
+
+        year, day = puzzle_from_path(input_file)
+        blob = store_input(year, day, account, input_file.read_text())
+        link_input(blob, input_file)
+        moved += 1
+
+    print(f"[green]Moved {moved} inputs to [not bold underline]{InputsDir}[/]!")
+
+
+def _create_solution_folder(puzzle: Puzzle) -> pathlib.Path:
+    from tools import engine
+
+    solution_folder = engine.solution_folder(puzzle.year, puzzle.day)
 
     if solution_folder.exists():
         print(
@@ -152,19 +241,93 @@ def new_day(day: Day = None, year: Year = None, next: Next = False) -> None:
     )
     solution_folder.mkdir(parents=True)
 
-    print("[bright_cyan]Pulling data...")
-    input_file = solution_folder / "input.txt"
-    input_data = try_fetch_input(puzzle.day, puzzle.year, _read_token())
-    input_file.write_text(input_data)
-
     print("[bright_cyan]Creating solution file...")
     solution_template = pathlib.Path("solution.py")
     solution_file = solution_folder / "solution.py"
     solution_file.write_text(solution_template.read_text())
 
+    return solution_folder
+
+
+@app.command("new")
+def new_day(
+    day: Day = None,
+    year: Year = None,
+    next: Next = False,
+    at_unlock: Annotated[
+        bool, typer.Option(help="Wait for the puzzle to unlock and pull its input right away")
+    ] = False,
+) -> None:
+    """Create a new day folder and pull data."""
+    if at_unlock:
+        _new_at_unlock(day, year)
+        return
+
+    puzzle = get_puzzle(None, day, year, next=next)
+    puzzle.save()
+
+    solution_folder = _create_solution_folder(puzzle)
+
+    print("[bright_cyan]Pulling data...")
+    _pull_input(puzzle.year, puzzle.day, solution_folder / "input.txt")
+
     print(f"[bold green]Day {puzzle.day}, {puzzle.year} created!")
 
 
+def _retrying(error: str, delay: float) -> None:
+    print(f"[yellow]{error}, retrying in {delay}s...")
+
+
+def _new_at_unlock(day: int | None, year: int | None) -> None:
+    from datetime import timedelta
+
+    from tools.store import account_id
+    from tools.store import link_input
+    from tools.store import put as store_input
+    from tools.unlock import fetch_at_unlock
+    from tools.unlock import next_puzzle
+    from tools.unlock import seconds_until
+    from tools.unlock import sleep_until
+    from tools.unlock import UnlockError
+    from tools.unlock import WARM_AHEAD
+    from tools.utils import create_client
+    from tools.utils import get_year
+    from tools.utils import unlock_time
+    from tools.utils import warm_up
+
+    if day:
+        year = year or get_year()
+    else:
+        year, day = next_puzzle()
+
+    puzzle = Puzzle(day=day, year=year, part=1)
+    puzzle.save()
+
+    token = _read_token()
+    solution_folder = _create_solution_folder(puzzle)
+
+    # everything that can be done ahead of time is, the input request is all that's left
+    unlock = unlock_time(year, day)
+    left = timedelta(seconds=max(0, round(seconds_until(unlock))))
+    local = unlock.astimezone()
+    print(f"[bright_cyan]Day {day}, {year} unlocks at {local:%H:%M:%S %Z}, in {left}...")
+    sleep_until(unlock - timedelta(seconds=WARM_AHEAD))
+
+    with create_client(token) as client:
+        print("[bright_cyan]Warming up the connection...")
+        warm_up(client, year)
+
+        try:
+            data = fetch_at_unlock(client, year, day, on_retry=_retrying)
+        except UnlockError as e:
+            print(f"[red]{e}")
+            raise typer.Exit(1)
+
+    after = max(0.0, -seconds_until(unlock))
+    link_input(store_input(year, day, account_id(token), data), solution_folder / "input.txt")
+    print(f"[bold green]Day {day}, {year} created, input pulled {after:.2f}s after unlock!")
+
+
 @app.command("run")
 def run_day(
     day: Day = None,
@@ -172,51 +335,663 @@ def run_day(
     part: Part = None,
     test: Annotated[bool, typer.Option("-t", "--test")] = False,
     submit: Annotated[bool, typer.Option()] = False,
+    isolate: Annotated[
+        bool, typer.Option(help="Run the solution in a separate `uv run` process")
+    ] = False,
+    all: Annotated[bool, typer.Option("--all", help="Run every solution")] = False,
+    jobs: Annotated[
+        int | None, typer.Option("--jobs", "-j", help="Number of worker processes")
+    ] = None,
+    bench: Annotated[bool, typer.Option(help="Benchmark the solution")] = False,
+    repeat: Annotated[int, typer.Option(min=1, help="Number of timed benchmark runs")] = 10,
+    profile: Annotated[bool, typer.Option(help="Profile the solution with cProfile")] = False,
+    top: Annotated[int, typer.Option(help="Number of functions to show when profiling")] = 20,
+    no_cache: Annotated[bool, typer.Option("--no-cache", help="Ignore cached answers")] = False,
 ) -> None:
     """Run the current puzzle."""
+    from tools import engine
+    from tools.history import record_run
+
+    if all:
+        _run_all(year, test, jobs, not no_cache)
+        return
+
     puzzle = get_puzzle(Puzzle.load(), day, year, part)
     print(f"[bright_cyan not bold]Running Day {puzzle.day}, {puzzle.year}, part {puzzle.part}...")
 
-    solution_folder = pathlib.Path(f"solutions/{puzzle.year}/day{puzzle.day:02d}")
-    solution_file = solution_folder / "solution.py"
+    solution_file = engine.solution_file(puzzle.year, puzzle.day)
 
     if not solution_file.exists():
         print(f"[red]Solution file [not bold underline]{solution_file}[/] not found!")
         raise typer.Exit()
 
-    command = f"uv run {solution_file.absolute()} --part {puzzle.part}"
+    if bench and isolate:
+        _bench_isolated(puzzle.year, puzzle.day, puzzle.part, repeat)
+        return
+
+    if bench:
+        record_run(_bench(puzzle.year, puzzle.day, puzzle.part, repeat))
+        return
+
+    if profile:
+        _profile(puzzle.year, puzzle.day, puzzle.part, top)
+        return
+
+    # the connection is set up while the solution runs, so submitting is a single round trip.
+    # It starts once the solution's worker is forked, forking with a thread running can
+    # deadlock the child on a lock the thread held
+    ran = threading.Event()
+    connecting: "list[Future[tuple[httpx.Client, int]]]" = []
+
+    def connect() -> None:
+        if submit and not test and not connecting:
+            connecting.append(_connect_in_background(puzzle.year, ran))
+
+    try:
+        start = time.perf_counter_ns()
+        if isolate:
+            # `uv run` is exec'd rather than forked, the thread can start straight away
+            connect()
+            answer = _run_isolated(solution_file, puzzle.part, test)
+        else:
+            answer = _run_in_process(
+                puzzle.year, puzzle.day, puzzle.part, test, not no_cache, on_started=connect
+            )
+
+        run_ns = time.perf_counter_ns() - start
+        ran.set()
+
+        if answer is None:
+            return
+
+        print(f"Result: {answer}")
+
+        if submit and not test:
+            # nothing was forked for a cached answer, so it connects now instead
+            overlapped = bool(connecting)
+            connect()
+            _submit(
+                puzzle.year,
+                puzzle.day,
+                puzzle.part,
+                answer,
+                connecting[0],
+                overlapped,
+                start,
+                run_ns,
+            )
+    finally:
+        ran.set()
+        for future in connecting:
+            _close_connection(future)
+
+
+def _connect_in_background(year: int, ran: threading.Event) -> "Future[tuple[httpx.Client, int]]":
+    from concurrent.futures import ThreadPoolExecutor
+
+    from tools.utils import create_client
+    from tools.utils import KEEPALIVE_EXPIRY
+    from tools.utils import warm_up
+
+    token = _read_token()
+
+    def connect() -> "tuple[httpx.Client, int]":
+        start = time.perf_counter_ns()
+        client = create_client(token)
+
+        try:
+            warm_up(client, year)
+            connect_ns = time.perf_counter_ns() - start
+
+            # a long running solution would outlast the idle connection, so keep it in use
+            while not ran.wait(KEEPALIVE_EXPIRY / 2):
+                warm_up(client, year)
+        except BaseException:
+            client.close()
+            raise
+
+        return client, connect_ns
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(connect)
+    executor.shutdown(wait=False)
+    return future
+
+
+def _close_connection(connecting: "Future[tuple[httpx.Client, int]]") -> None:
+    # a connection that failed has already closed its client, and mustn't hide how the run went
+    if connecting.exception() is None:
+        connecting.result()[0].close()
+
+
+def _wait(seconds: float) -> None:
+    print(f"[yellow]Waiting {seconds:.0f}s until an answer will be accepted...")
+    time.sleep(seconds)
+
+
+def _submit(
+    year: int,
+    day: int,
+    part: int,
+    answer: str,
+    connecting: "Future[tuple[httpx.Client, int]]",
+    overlapped: bool,
+    start: int,
+    run_ns: int,
+) -> None:
+    from tools.ledger import Refused
+    from tools.ledger import submit
+    from tools.runnner import create_timing_table
+
+    client: "httpx.Client | None" = None
+    connect_ns = None
+    if (error := connecting.exception()) is not None:
+        print(f"[yellow]Couldn't connect ahead of submitting: {error}")
+    else:
+        client, connect_ns = connecting.result()
+
+    submit_start = time.perf_counter_ns()
+    try:
+        verdict = submit(year, day, part, answer, _read_token(), on_wait=_wait, client=client)
+    except Refused as e:
+        print(f"[bold yellow]Not submitted![/] {e}")
+        raise typer.Exit(1)
+
+    submit_ns = time.perf_counter_ns() - submit_start
+
+    table = create_timing_table()
+    table.add_row("run", format_ns(run_ns))
+    if connect_ns is not None:
+        table.add_row(
+            "connect (while running)" if overlapped else "connect", format_ns(connect_ns)
+        )
+    table.add_row("submit", format_ns(submit_ns))
+    table.add_row("run to verdict", format_ns(time.perf_counter_ns() - start))
+    print(table)
+
+    if verdict.status == "Correct":
+        print("[bold green]Correct!")
+    elif verdict.status == "Already completed":
+        print("[bold yellow]Already completed!")
+    elif verdict.hint:
+        print(f"[bold red]{verdict.status}[/], your answer is {verdict.hint}")
+    else:
+        print(f"[bold red]{verdict.status}[/]")
+
+
+def _run_all(year: int | None, test: bool, jobs: int | None, use_cache: bool) -> None:
+    from tools.batch import run_batch
+
+    target = f"{year}" if year else "all years"
+    print(f"[bright_cyan not bold]Running every solution for {target}...")
+
+    results = run_batch(year, test, jobs, use_cache=use_cache)
+    print()
+
+    failed = [r for r in results if r.status in ("fail", "error", "timeout", "oom")]
+    if failed:
+        print(f"[bold red]{len(failed)} of {len(results)} jobs failed!")
+        raise typer.Exit(1)
+
+    print(f"[bold green]All {len(results)} jobs finished!")
+
+
+def _bench_isolated(year: int, day: int, part: int, repeat: int) -> None:
+    import subprocess
+
+    from tools import engine
+
+    solution_file = engine.solution_file(year, day)
+    command = f"uv run {solution_file.absolute()} --part {part} --bench --repeat {repeat}"
+    print(f"[bright_black not bold]{command}[/]\n")
+    subprocess.run(command, shell=True)
+
+
+def _bench(year: int, day: int, part: int, repeat: int) -> "BenchRecord":
+    from tools import engine
+    from tools.bench import add_bench_row
+    from tools.bench import benchmark
+    from tools.bench import create_bench_table
+    from tools.history import create_record
+
+    try:
+        solution = engine.load_solution(year, day)
+        input_data = engine.read_input(solution.input_file, solution.input_mode)
+    except engine.SolutionError as e:
+        print(f"[red]{e}")
+        raise typer.Exit()
+
+    table = create_bench_table()
+    if solution.parse:
+        add_bench_row(table, "parse", benchmark(solution.parse, input_data, repeat=repeat))
+
+    parsed, _ = engine.load_input(solution)
+    stats = benchmark(solution.part(part), parsed, repeat=repeat)
+    add_bench_row(table, str(part), stats)
+    print(table)
+
+    solution_file = engine.solution_file(year, day)
+    return create_record(solution_file, solution.input_file, part, stats.samples)
+
+
+def _profile(year: int, day: int, part: int, top: int) -> None:
+    from tools import engine
+    from tools.profiling import create_profile_table
+    from tools.profiling import profile_part
+
+    try:
+        solution = engine.load_solution(year, day)
+        result = profile_part(solution, part)
+    except engine.SolutionError as e:
+        print(f"[red]{e}")
+        raise typer.Exit()
+
+    print(create_profile_table(result.stats, top))
+    print(f"[bright_black not bold]Saved profile to {result.stats_file}[/]\n")
+    print(f"Result: {result.answer}")
+
+
+def _run_isolated(solution_file: pathlib.Path, part: int, test: bool) -> str | None:
+    import subprocess
+
+    command = f"uv run {solution_file.absolute()} --part {part}"
 
     if test:
         command = f"{command} --test"
         print(f"[bright_black not bold]{command}[/]\n")
         subprocess.run(command, shell=True)
-        return
+        return None
 
     print(f"[bright_black not bold]{command}[/]\n")
     process = subprocess.run(command, shell=True, capture_output=True, text=True)
-    answer = process.stdout.strip()
-    print(f"Result: {answer}")
+    return process.stdout.strip()
 
-    if submit:
-        status = submit_answer(puzzle.day, puzzle.year, _read_token(), puzzle.part, answer)
 
-        if status == "Correct":
-            print("[bold green]Correct!")
-        elif status == "Already completed":
-            print("[bold yellow]Already completed!")
-        else:
-            print(f"[bold red]{status}[/]")
+def _run_via_daemon(
+    year: int, day: int, part: int, test: bool, use_cache: bool
+) -> "RunResult | list[TestResult] | None":
+    from tools import engine
+    from tools.client import request_run
+    from tools.testcases import TestResult
+
+    response = request_run(year, day, part, test, use_cache)
+    if response is None:
+        return None
+
+    if "error" in response:
+        raise engine.SolutionError(response["error"])
+
+    if test:
+        return [TestResult(**tc) for tc in response["tests"]]
+
+    return engine.RunResult(**response["result"])
+
+
+def _run_locally(
+    year: int,
+    day: int,
+    part: int,
+    test: bool,
+    use_cache: bool,
+    on_started: Callable[[], None] | None = None,
+) -> "RunResult | list[TestResult]":
+    from tools import engine
+    from tools.cache import AnswerCache
+
+    solution = engine.load_solution(year, day)
+
+    if test:
+        return engine.run_tests(solution, part)
+
+    if not use_cache:
+        return engine.run_part(solution, part, on_started=on_started)
+
+    cache = AnswerCache.load()
+    result = engine.run_part(solution, part, cache=cache, on_started=on_started)
+    cache.save()
+    return result
+
+
+def _print_test_results(results: "list[TestResult]") -> None:
+    from tools.runnner import add_row
+    from tools.runnner import create_test_result_table
+
+    table = create_test_result_table()
+    for tc in results:
+        add_row(table, tc)
+
+    print(table)
+
+
+def _run_in_process(
+    year: int,
+    day: int,
+    part: int,
+    test: bool,
+    use_cache: bool,
+    on_started: Callable[[], None] | None = None,
+) -> str | None:
+    from tools import engine
+
+    try:
+        result = _run_via_daemon(year, day, part, test, use_cache)
+        if result is None:
+            result = _run_locally(year, day, part, test, use_cache, on_started)
+    except engine.SolutionError as e:
+        print(f"[red]{e}")
+        raise typer.Exit()
+
+    if isinstance(result, list):
+        _print_test_results(result)
+        return None
+
+    if result.status != "ok":
+        print(f"[bold red]{result.status.upper()}[/]: {result.error}")
+        raise typer.Exit(1)
+
+    timing = f"Solved in {format_ns(result.elapsed_ns)}"
+    if result.cached:
+        timing = f"Cached answer, originally solved in {format_ns(result.elapsed_ns)}"
+    elif result.parse_ns:
+        timing = f"Parsed in {format_ns(result.parse_ns)}, {timing.lower()}"
+
+    print(f"[bright_black not bold]{timing}[/]\n")
+    return str(result.answer)
+
+
+@app.command("bench")
+def bench_day(
+    day: Day = None,
+    year: Year = None,
+    part: Part = None,
+    repeat: Annotated[int, typer.Option(min=1, help="Number of timed benchmark runs")] = 10,
+    compare: Annotated[
+        bool, typer.Option(help="Fail if slower than the recent recorded benchmarks")
+    ] = False,
+    accept: Annotated[
+        bool, typer.Option(help="Record the run as part of the baseline even if it is slower")
+    ] = False,
+) -> None:
+    """Benchmark the current puzzle and record the result."""
+    from tools.history import BASELINE_RUNS
+    from tools.history import record_run
+
+    puzzle = get_puzzle(Puzzle.load(), day, year, part)
+    print(f"[bright_cyan not bold]Benchmarking Day {puzzle.day}, {puzzle.year}...")
+
+    record = _bench(puzzle.year, puzzle.day, puzzle.part, repeat)
+    result = record_run(record, accept)
+
+    if result is None:
+        if compare:
+            print("[yellow]No baseline recorded yet!")
+        return
+
+    if result.regressed and not accept:
+        print("[yellow]Slower than the baseline, not recorded! Use --accept to keep it.")
+
+    if not compare:
+        return
+
+    print(
+        f"Median is {result.ratio:.2f}x the baseline of up to {BASELINE_RUNS} runs "
+        f"since {result.baseline.timestamp} (p={result.p_value:.4f})"
+    )
+
+    if result.regressed:
+        print("[bold red]Slower than the baseline!")
+        raise typer.Exit(1)
+
+    print("[bold green]No regression detected!")
+
+
+@app.command("gen")
+def generate_input(
+    day: Day = None,
+    year: Year = None,
+    scale: Annotated[int, typer.Option(help="How big the input should be")] = 1000,
+    seed: Annotated[int, typer.Option(help="Seed for the random generator")] = 0,
+) -> None:
+    """Generate a synthetic input for the current puzzle."""
+    from tools import engine
+    from tools.generate import generated_file
+    from tools.generate import write_input
+
+    puzzle = get_puzzle(Puzzle.load(), day, year)
+
+    try:
+        solution = engine.load_solution(puzzle.year, puzzle.day)
+    except engine.SolutionError as e:
+        print(f"[red]{e}")
+        raise typer.Exit()
+
+    if solution.generate is None:
+        print(f"[red]Day {puzzle.day}, {puzzle.year} has no [not bold]generate[/] function!")
+        raise typer.Exit(1)
+
+    path = generated_file(puzzle.year, puzzle.day, scale, seed)
+    print(f"[bright_cyan not bold]Generating [not bold underline]{path}[/]...")
+
+    start = time.perf_counter_ns()
+    size = write_input(solution.generate, path, scale, seed)
+    elapsed = time.perf_counter_ns() - start
+
+    print(f"[green]Wrote {format_bytes(size)} in {format_ns(elapsed)}!")
+
+    solution_file = engine.solution_file(puzzle.year, puzzle.day)
+    print(f"[bright_black not bold]uv run {solution_file} --input {path}[/]")
+
+
+@app.command("scale")
+def scale_day(
+    day: Day = None,
+    year: Year = None,
+    part: Part = None,
+    start: Annotated[int, typer.Option(help="Smallest generated input scale")] = 100,
+    factor: Annotated[float, typer.Option(help="Growth between input scales")] = 2.0,
+    steps: Annotated[int, typer.Option(help="Number of input scales")] = 6,
+    seed: Annotated[int, typer.Option(help="Seed for the random generator")] = 0,
+    limit: Annotated[float, typer.Option(help="Stop once a run takes this many seconds")] = 10.0,
+) -> None:
+    """Fit how the current puzzle's runtime grows with generated input size."""
+    from rich.live import Live
+
+    from tools import engine
+    from tools.generate import generated_file
+    from tools.generate import write_input
+    from tools.scaling import add_scaling_row
+    from tools.scaling import create_fit_table
+    from tools.scaling import create_scaling_table
+    from tools.scaling import fit_models
+    from tools.scaling import ScalePoint
+    from tools.scaling import sizes
+    from tools.scaling import time_part
+    from tools.worker import run_in_subprocess
+    from tools.worker import Task
+
+    puzzle = get_puzzle(Puzzle.load(), day, year, part)
+    print(f"[bright_cyan not bold]Scaling Day {puzzle.day}, {puzzle.year}, part {puzzle.part}...")
+
+    try:
+        solution = engine.load_solution(puzzle.year, puzzle.day)
+    except engine.SolutionError as e:
+        print(f"[red]{e}")
+        raise typer.Exit()
+
+    if solution.generate is None:
+        print(f"[red]Day {puzzle.day}, {puzzle.year} has no [not bold]generate[/] function!")
+        raise typer.Exit(1)
+
+    table = create_scaling_table(puzzle.part)
+    points: list[ScalePoint] = []
+
+    with Live(table, auto_refresh=False) as live:
+        for n in sizes(start, factor, steps):
+            path = generated_file(puzzle.year, puzzle.day, n, seed)
+            if not path.exists():
+                write_input(solution.generate, path, n, seed)
+
+            task = Task(time_part, (solution, puzzle.part, path), limit, solution.budget.memory)
+            outcome = run_in_subprocess(task)
+            if outcome.status != "ok":
+                table.add_row(str(n), f"[red]{outcome.status.upper()}", "")
+                live.refresh()
+                break
+
+            point = ScalePoint(n, outcome.result)
+            add_scaling_row(table, point, points[-1] if points else None)
+            points.append(point)
+            live.refresh()
+
+    print()
+    if len(points) < 3:
+        print("[red]Need at least 3 sizes to fit a model!")
+        raise typer.Exit(1)
+
+    print(create_fit_table(fit_models(points), 10 * points[-1].n))
+
+
+@app.command("startup")
+def startup(
+    module: Annotated[list[str] | None, typer.Argument(help="Modules to time")] = None,
+    budget: Annotated[float | None, typer.Option(help="Override the budget, in ms")] = None,
+    runs: Annotated[int, typer.Option(help="Number of fresh interpreters to time")] = 5,
+    top: Annotated[int, typer.Option(help="Number of imports to show")] = 10,
+) -> None:
+    """Time the cold start imports and fail if one is over its budget."""
+    from tools.startup import BUDGETS_MS
+    from tools.startup import create_startup_table
+    from tools.startup import measure_startup
+
+    over = []
+    for name in module or list(BUDGETS_MS):
+        limit = budget if budget is not None else BUDGETS_MS.get(name)
+        if limit is None:
+            print(f"[red]No budget for [not bold]{name}[/], set one with [not bold]--budget[/]")
+            raise typer.Exit(1)
+
+        result = measure_startup(name, runs)
+        print(create_startup_table(result, limit, top))
+        if result.total_us > limit * 1000:
+            over.append(name)
+
+    if over:
+        print(f"[bold red]{', '.join(over)} over budget!")
+        raise typer.Exit(1)
+
+    print("[bold green]All imports within budget!")
+
+
+Latency = Annotated[float, typer.Option(help="Seconds added to every response")]
+ErrorRate = Annotated[float, typer.Option(help="Share of requests that get a 500")]
+RateLimitRate = Annotated[float, typer.Option(help="Share of requests that get a 429")]
+
+
+@app.command("serve")
+def serve_standin(
+    port: Annotated[int, typer.Option(help="Port to listen on")] = 8000,
+    latency: Latency = 0.0,
+    errors: ErrorRate = 0.0,
+    rate_limits: RateLimitRate = 0.0,
+) -> None:
+    """Serve a local stand-in for adventofcode.com."""
+    from tools.server import ServerConfig
+    from tools.server import StandInServer
+
+    config = ServerConfig(latency=latency, error_rate=errors, rate_limit_rate=rate_limits)
+
+    with StandInServer(config, port) as server:
+        print(f"[bright_cyan]Listening on [not bold underline]{server.url}[/]...")
+        print(f"[bright_black not bold]AOC_BASE_URL={server.url} aoc pull --all[/]")
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print(f"[bright_cyan]Stopping after {server.stats['requests']} requests...")
+
+
+@app.command("netbench")
+def netbench(
+    calls: Annotated[int, typer.Option(help="Number of calls per scenario")] = 25,
+    latency: Latency = 0.02,
+    errors: ErrorRate = 0.1,
+    rate_limits: RateLimitRate = 0.05,
+    retry_delay: Annotated[int, typer.Option(help="Seconds try_fetch_input waits")] = 1,
+) -> None:
+    """Time fetching and submitting against a local stand-in server."""
+    from tools.netbench import add_netbench_row
+    from tools.netbench import create_netbench_table
+    from tools.netbench import run_netbench
+    from tools.server import ServerConfig
+
+    config = ServerConfig(latency=latency, error_rate=errors, rate_limit_rate=rate_limits)
+    print(f"[bright_cyan not bold]Timing {calls} calls per scenario...")
+
+    table = create_netbench_table(config)
+    for result in run_netbench(config, calls, retry_delay):
+        add_netbench_row(table, result)
+
+    print(table)
+
+
+@app.command("daemon")
+def daemon() -> None:
+    """Keep a warm interpreter around for `aoc run` to talk to."""
+    from tools import engine
+    from tools.client import SocketFile
+    from tools.daemon import serve
+
+    print(f"[bright_cyan]Listening on [not bold underline]{SocketFile}[/]...")
+
+    try:
+        serve()
+    except engine.SolutionError as e:
+        print(f"[red]{e}")
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        print("[bright_cyan]Stopping daemon...")
+
+
+def _dev_run() -> None:
+    from tools import engine
+
+    puzzle = Puzzle.load()
+    if puzzle is None:
+        print("[red]No current puzzle, set one with [not bold]aoc set[/]")
+        return
+
+    print(f"[bright_cyan not bold]Testing Day {puzzle.day}, {puzzle.year}, part {puzzle.part}...")
+
+    try:
+        solution = engine.load_solution(puzzle.year, puzzle.day)
+        _print_test_results(engine.run_tests(solution, puzzle.part))
+    except engine.SolutionError as e:
+        print(f"[red]{e}")
 
 
 @app.command("dev")
 def dev() -> None:
     """Continuously run tests for the current puzzle."""
-
-    file_watcher = "watchexec"
-    cmd = f"{file_watcher} -w solutions/ -w .current_puzzle -- aoc run --test"
-    print(f"[bright_black not bold]{cmd}[/]\n")
-
-    subprocess.run(cmd, shell=True)
+    from tools import engine
+    from tools.watcher import cancel_run
+    from tools.watcher import start_run
+    from tools.watcher import watch
+
+    paths = [engine.SolutionsDir, CurrentPuzzleFile]
+    print(f"[bright_black not bold]Watching {', '.join(map(str, paths))}...[/]\n")
+
+    run = start_run(_dev_run)
+
+    try:
+        for changes in watch(paths):
+            if cancel_run(run):
+                print("[yellow]Cancelled the previous run[/]\n")
+
+            changed = ", ".join(sorted(str(path) for path in changes))
+            print(f"[bright_black not bold]Changed: {changed}[/]")
+            run = start_run(_dev_run)
+    except KeyboardInterrupt:
+        cancel_run(run)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,39 @@
+import json
+import pathlib
+import socket
+from typing import Any
+
+SocketFile = pathlib.Path(".aoc.sock")
+
+
+class DaemonError(Exception):
+    pass
+
+
+def send(message: dict[str, Any], socket_file: pathlib.Path = SocketFile) -> dict[str, Any] | None:
+    """Send a request to a running `aoc daemon`, or return None if there is none."""
+    if not socket_file.exists():
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_file))
+        except (ConnectionRefusedError, FileNotFoundError):
+            return None
+
+        sock.sendall(json.dumps(message).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+
+    if not line:
+        raise DaemonError("Daemon closed the connection without a response!")
+
+    response: dict[str, Any] = json.loads(line)
+    return response
+
+
+def request_run(
+    year: int, day: int, part: int, test: bool = False, use_cache: bool = True
+) -> dict[str, Any] | None:
+    message = {"year": year, "day": day, "part": part, "test": test, "cache": use_cache}
+    return send({"command": "run", **message})
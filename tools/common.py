@@ -1 +1,60 @@
+import random
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Literal
+from typing import NamedTuple
+
+from tools.stream import Lines
+from tools.stream import Records
+
 Point = tuple[int, int]
+
+# "text" solutions get the input as a str, "bytes" solutions as a memoryview of its bytes,
+# "lines" and "records" solutions a `Lines` or `Records` to iterate over
+InputMode = Literal["text", "bytes", "lines", "records"]
+InputData = str | memoryview | Lines | Records
+
+ParseFn = Callable[[Any], Any]
+PartFn = Callable[[Any], int | str]
+
+# yields the chunks of an input that grows with `scale`, drawing from the seeded `Random`
+GenerateFn = Callable[[int, random.Random], Iterable[str]]
+
+TestCase = tuple[str, int | str]
+TestCases = tuple[list[TestCase], list[TestCase]]
+
+
+class Budget(NamedTuple):
+    time: float | None = 60.0
+    memory: int | None = 4 << 30
+
+
+DEFAULT_BUDGET = Budget()
+
+
+def format_ns(ns: int) -> str:
+    if ns < 1_000:
+        return f"{ns} ns"
+
+    if ns < 1_000_000:
+        return f"{ns / 1_000:.1f} µs"
+
+    if ns < 1_000_000_000:
+        return f"{ns / 1_000_000:.1f} ms"
+
+    return f"{ns / 1_000_000_000:.2f} s"
+
+
+def format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+
+    value = size / 1024
+    for unit in ("KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+
+        value /= 1024
+
+    return f"{value:.2f} GiB"
@@ -0,0 +1,98 @@
+import json
+import os
+import pathlib
+import signal
+import socketserver
+import sys
+from typing import Any
+
+from tools import engine
+from tools.cache import AnswerCache
+from tools.client import send
+from tools.client import SocketFile
+
+
+class SolutionCache:
+    """Keep loaded solutions around, reloading them when solution.py changes."""
+
+    def __init__(self) -> None:
+        self.solutions: dict[tuple[int, int], tuple[int, engine.Solution]] = {}
+
+    def get(self, year: int, day: int) -> engine.Solution:
+        path = engine.solution_file(year, day)
+        if not path.exists():
+            raise engine.SolutionError(f"Solution file {path} not found!")
+
+        mtime = path.stat().st_mtime_ns
+        cached = self.solutions.get((year, day))
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        solution = engine.load_solution(year, day)
+        self.solutions[year, day] = (mtime, solution)
+        return solution
+
+
+def handle(cache: SolutionCache, message: dict[str, Any]) -> dict[str, Any]:
+    if message.get("command") == "ping":
+        return {"pid": os.getpid()}
+
+    if message.get("command") != "run":
+        return {"error": f"Unknown command {message.get('command')!r}"}
+
+    try:
+        solution = cache.get(message["year"], message["day"])
+
+        if message["test"]:
+            tests = engine.run_tests(solution, message["part"])
+            return {"tests": [tc._asdict() for tc in tests]}
+
+        if not message.get("cache", True):
+            result = engine.run_part(solution, message["part"])
+        else:
+            answers = AnswerCache.load()
+            result = engine.run_part(solution, message["part"], cache=answers)
+            answers.save()
+    except engine.SolutionError as e:
+        return {"error": str(e)}
+
+    return {"result": result._asdict()}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+
+        try:
+            response = handle(self.server.cache, json.loads(line))
+        except Exception as e:
+            response = {"error": f"{type(e).__name__}: {e}"}
+
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_file: pathlib.Path) -> None:
+        self.cache = SolutionCache()
+        super().__init__(str(socket_file), _Handler)
+
+
+def serve(socket_file: pathlib.Path = SocketFile) -> None:
+    if socket_file.exists():
+        if send({"command": "ping"}, socket_file) is not None:
+            raise engine.SolutionError(f"A daemon is already listening on {socket_file}!")
+
+        socket_file.unlink()
+
+    # exit cleanly on `kill` so the socket file gets removed
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    try:
+        with DaemonServer(socket_file) as server:
+            server.serve_forever()
+    finally:
+        socket_file.unlink(missing_ok=True)
@@ -0,0 +1,223 @@
+import asyncio
+import random
+import time
+from datetime import datetime
+from datetime import timezone
+from email.utils import format_datetime
+from typing import Callable
+from typing import Literal
+from typing import NamedTuple
+
+import httpx
+from rich.live import Live
+from rich.table import Table
+
+from tools import engine
+from tools import store
+from tools.common import format_bytes
+from tools.common import format_ns
+from tools.utils import base_url
+from tools.utils import days_in_year
+from tools.utils import get_headers
+from tools.utils import unlock_time
+
+# be polite, this is someone's side project and not a CDN
+MAX_CONCURRENCY = 4
+MIN_INTERVAL = 0.1
+
+ATTEMPTS = 5
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+Status = Literal["linked", "downloaded", "not modified", "skipped", "failed"]
+
+
+class Download(NamedTuple):
+    day: int
+    status: Status
+    size: int = 0
+    elapsed_ns: int = 0
+    error: str = ""
+
+
+def unlocked_days(year: int, now: datetime | None = None) -> list[int]:
+    now = now or datetime.now(timezone.utc)
+    days = range(1, days_in_year(year) + 1)
+    return [day for day in days if unlock_time(year, day) <= now]
+
+
+def backoff_delay(attempt: int, rng: random.Random) -> float:
+    """Exponential backoff with full jitter, so retries from parallel requests spread out."""
+    return rng.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
+
+
+def retry_after(response: httpx.Response) -> float | None:
+    try:
+        return min(float(response.headers["Retry-After"]), BACKOFF_CAP)
+    except (KeyError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Spaces out the start of requests by at least `interval` seconds."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.next_start = 0.0
+        self.lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self.lock:
+            delay = self.next_start - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            self.next_start = time.monotonic() + self.interval
+
+
+def checked(response: httpx.Response) -> httpx.Response:
+    # a 304 isn't an error here, raise_for_status would treat it as one
+    return response.raise_for_status() if response.is_error else response
+
+
+async def fetch(
+    client: httpx.AsyncClient,
+    limiter: RateLimiter,
+    url: str,
+    headers: dict[str, str],
+    rng: random.Random,
+) -> httpx.Response:
+    for attempt in range(ATTEMPTS - 1):
+        await limiter.wait()
+
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.TransportError:
+            await asyncio.sleep(backoff_delay(attempt, rng))
+            continue
+
+        if response.status_code not in RETRY_STATUSES:
+            return checked(response)
+
+        delay = retry_after(response)
+        await asyncio.sleep(backoff_delay(attempt, rng) if delay is None else delay)
+
+    await limiter.wait()
+    return checked(await client.get(url, headers=headers))
+
+
+async def pull_day(
+    client: httpx.AsyncClient,
+    limiter: RateLimiter,
+    year: int,
+    day: int,
+    account: str,
+    refresh: bool,
+    rng: random.Random,
+) -> Download:
+    input_file = engine.solution_folder(year, day) / "input.txt"
+    if input_file.exists() and not refresh:
+        return Download(day, "skipped")
+
+    blob = store.find(year, day, account)
+    if blob and not refresh:
+        store.link_input(blob, input_file)
+        return Download(day, "linked", blob.stat().st_size)
+
+    # inputs never change, so a stored one only needs checking, not downloading again
+    headers = {}
+    if blob:
+        modified = datetime.fromtimestamp(blob.stat().st_mtime, timezone.utc)
+        headers["If-Modified-Since"] = format_datetime(modified, usegmt=True)
+
+    start = time.perf_counter_ns()
+    try:
+        response = await fetch(client, limiter, f"/{year}/day/{day}/input", headers, rng)
+    except httpx.HTTPError as e:
+        return Download(day, "failed", error=str(e) or type(e).__name__)
+
+    elapsed = time.perf_counter_ns() - start
+
+    if blob and response.status_code == 304:
+        store.link_input(blob, input_file)
+        return Download(day, "not modified", blob.stat().st_size, elapsed)
+
+    blob = store.put(year, day, account, response.text)
+    store.link_input(blob, input_file)
+    return Download(day, "downloaded", len(response.content), elapsed)
+
+
+def create_download_table(year: int) -> Table:
+    table = Table(title=f"DOWNLOADS ({year})", min_width=80, title_justify="left")
+    table.add_column("DAY")
+    table.add_column("SIZE", justify="right", style="cyan")
+    table.add_column("TIME", justify="right", style="yellow")
+    table.add_column("STATUS")
+
+    return table
+
+
+def add_download_row(table: Table, download: Download) -> None:
+    status_str = {
+        "linked": "[green]LINKED",
+        "downloaded": "[green]DOWNLOADED",
+        "not modified": "[green]NOT MODIFIED",
+        "skipped": "[bright_black]SKIPPED",
+        "failed": f"[red]FAILED[/] {download.error}",
+    }[download.status]
+
+    size = format_bytes(download.size) if download.size else ""
+    elapsed = format_ns(download.elapsed_ns) if download.elapsed_ns else ""
+    table.add_row(str(download.day), size, elapsed, status_str)
+
+
+async def pull_days(
+    year: int,
+    days: list[int],
+    token: str,
+    refresh: bool = False,
+    on_done: Callable[[Download], None] | None = None,
+) -> list[Download]:
+    """Pull the inputs of `days` into the store, and link them into their solution folders."""
+    account = store.account_id(token)
+    limiter = RateLimiter(MIN_INTERVAL)
+    rng = random.Random()
+
+    limits = httpx.Limits(
+        max_connections=MAX_CONCURRENCY,
+        max_keepalive_connections=MAX_CONCURRENCY,
+    )
+    async with httpx.AsyncClient(
+        base_url=base_url(),
+        headers=get_headers(token),
+        limits=limits,
+        timeout=httpx.Timeout(10.0, pool=None),
+    ) as client:
+
+        async def pull(day: int) -> Download:
+            download = await pull_day(client, limiter, year, day, account, refresh, rng)
+            if on_done is not None:
+                on_done(download)
+
+            return download
+
+        return list(await asyncio.gather(*map(pull, days)))
+
+
+def pull_year(
+    year: int,
+    token: str,
+    refresh: bool = False,
+) -> list[Download]:
+    """Pull the inputs of every unlocked day of `year` that has a solution folder."""
+    days = [day for day in unlocked_days(year) if engine.solution_folder(year, day).exists()]
+    table = create_download_table(year)
+
+    with Live(table, auto_refresh=False) as live:
+
+        def on_done(download: Download) -> None:
+            add_download_row(table, download)
+            live.refresh()
+
+        return asyncio.run(pull_days(year, days, token, refresh, on_done))
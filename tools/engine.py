@@ -0,0 +1,262 @@
+import importlib.util
+import mmap
+import os
+import pathlib
+import sys
+import time
+from types import ModuleType
+from typing import Any
+from typing import Callable
+from typing import NamedTuple
+
+from tools.cache import AnswerCache
+from tools.cache import cache_key
+from tools.cache import CachedAnswer
+from tools.cache import discard_parsed
+from tools.cache import load_parsed
+from tools.cache import MIN_PARSE_NS
+from tools.cache import save_parsed
+from tools.common import Budget
+from tools.common import DEFAULT_BUDGET
+from tools.common import GenerateFn
+from tools.common import InputData
+from tools.common import InputMode
+from tools.common import ParseFn
+from tools.common import PartFn
+from tools.common import TestCases
+from tools.store import restore_input
+from tools.stream import Lines
+from tools.stream import Records
+from tools.testcases import run_test_cases
+from tools.testcases import TestResult
+from tools.worker import run_in_subprocess
+from tools.worker import Status
+from tools.worker import Task
+
+SolutionsDir = pathlib.Path("solutions")
+
+WHITESPACE = b" \t\r\n"
+
+
+class Solution(NamedTuple):
+    year: int
+    day: int
+    part1: PartFn
+    part2: PartFn
+    input_file: pathlib.Path
+    test_cases: TestCases
+    parse: ParseFn | None = None
+    budget: Budget = DEFAULT_BUDGET
+    input_mode: InputMode = "text"
+    generate: GenerateFn | None = None
+
+    def part(self, part: int) -> PartFn:
+        return {1: self.part1, 2: self.part2}[part]
+
+    def parse_input(self, input_data: InputData) -> tuple[Any, int]:
+        if self.parse is None:
+            return input_data, 0
+
+        start = time.perf_counter_ns()
+        parsed = self.parse(input_data)
+        return parsed, time.perf_counter_ns() - start
+
+
+class RunResult(NamedTuple):
+    year: int
+    day: int
+    part: int
+    answer: int | str | None
+    elapsed_ns: int
+    parse_ns: int = 0
+    status: Status = "ok"
+    error: str = ""
+    cached: bool = False
+
+
+class SolutionError(Exception):
+    pass
+
+
+class InputNotFound(SolutionError):
+    pass
+
+
+def solution_folder(year: int, day: int) -> pathlib.Path:
+    return SolutionsDir / str(year) / f"day{day:02d}"
+
+
+def solution_file(year: int, day: int) -> pathlib.Path:
+    return solution_folder(year, day) / "solution.py"
+
+
+def import_solution(year: int, day: int) -> ModuleType:
+    path = solution_file(year, day)
+    if not path.exists():
+        raise SolutionError(f"Solution file {path} not found!")
+
+    module_name = f"solutions_{year}_day{day:02d}"
+    spec = importlib.util.spec_from_file_location(module_name, path.absolute())
+    if spec is None or spec.loader is None:
+        raise SolutionError(f"Unable to load {path}!")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_solution(year: int, day: int) -> Solution:
+    module = import_solution(year, day)
+    restore_input(year, day, module.INPUT_FILE)
+
+    return Solution(
+        year=year,
+        day=day,
+        part1=module.part1,
+        part2=module.part2,
+        input_file=module.INPUT_FILE,
+        test_cases=module.TEST_CASES,
+        parse=getattr(module, "parse", None),
+        budget=getattr(module, "BUDGET", DEFAULT_BUDGET),
+        input_mode=getattr(module, "INPUT_MODE", "text"),
+        generate=getattr(module, "generate", None),
+    )
+
+
+def _read_buffer(input_file: pathlib.Path) -> memoryview:
+    with input_file.open("rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return memoryview(b"")
+
+        # the view keeps the map alive, the file can be closed
+        buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    start, end = 0, len(buffer)
+    while start < end and buffer[start] in WHITESPACE:
+        start += 1
+
+    while end > start and buffer[end - 1] in WHITESPACE:
+        end -= 1
+
+    return buffer[start:end]
+
+
+def read_input(input_file: pathlib.Path, input_mode: InputMode = "text") -> InputData:
+    """The input without surrounding whitespace.
+
+    Bytes inputs are memory-mapped rather than copied, lines and records inputs are read
+    lazily every time they are iterated.
+    """
+    if not input_file.exists():
+        raise InputNotFound(f"Input file {input_file} not found!")
+
+    if input_mode == "bytes":
+        return _read_buffer(input_file)
+
+    if input_mode == "lines":
+        return Lines.from_file(input_file)
+
+    if input_mode == "records":
+        return Records(Lines.from_file(input_file))
+
+    return input_file.read_text().strip()
+
+
+def load_input(solution: Solution, use_cache: bool = True) -> tuple[Any, int]:
+    """Read and parse the input, loading the parsed input saved by a previous run if possible."""
+    input_data = read_input(solution.input_file, solution.input_mode)
+    if solution.parse is None or not use_cache:
+        return solution.parse_input(input_data)
+
+    start = time.perf_counter_ns()
+    if (parsed := load_parsed(solution.parse, solution.input_file)) is not None:
+        return parsed, time.perf_counter_ns() - start
+
+    parsed, parse_ns = solution.parse_input(input_data)
+    if parse_ns >= MIN_PARSE_NS:
+        save_parsed(solution.parse, solution.input_file, parsed)
+    else:
+        discard_parsed(solution.input_file)
+
+    return parsed, parse_ns
+
+
+def run_part(
+    solution: Solution,
+    part: int,
+    isolate: bool = True,
+    cache: AnswerCache | None = None,
+    on_started: Callable[[], None] | None = None,
+) -> RunResult:
+    return run_parts(solution, [part], isolate, cache, on_started)[0]
+
+
+def run_parts(
+    solution: Solution,
+    parts: list[int],
+    isolate: bool = True,
+    cache: AnswerCache | None = None,
+    on_started: Callable[[], None] | None = None,
+) -> list[RunResult]:
+    """Run the parts off a single parse, each in a child process held to the budget.
+
+    With a `cache`, parts whose code and input are unchanged since a previous run return the
+    cached answer without running, and new answers are added to it. The parsed input is
+    cached on disk as well.
+
+    `on_started` is called once the last child process has been forked, it isn't called if
+    nothing had to run in one.
+    """
+    if not solution.input_file.exists():
+        raise InputNotFound(f"Input file {solution.input_file} not found!")
+
+    results: dict[int, RunResult] = {}
+    keys: dict[int, str] = {}
+
+    if cache is not None:
+        for part in parts:
+            keys[part] = cache_key(solution.part(part), solution.parse, solution.input_file)
+            if entry := cache.get(keys[part]):
+                answer, elapsed, parse_ns = entry
+                result = RunResult(solution.year, solution.day, part, answer, elapsed, parse_ns)
+                results[part] = result._replace(cached=True)
+
+    remaining = [part for part in parts if part not in results]
+    if remaining:
+        parsed, parse_ns = load_input(solution, use_cache=cache is not None)
+
+    for part in remaining:
+        fn = solution.part(part)
+
+        result = RunResult(solution.year, solution.day, part, None, 0, parse_ns)
+
+        if not isolate:
+            start = time.perf_counter_ns()
+            answer = fn(parsed)
+            elapsed = time.perf_counter_ns() - start
+            result = result._replace(answer=answer, elapsed_ns=elapsed)
+        else:
+            budget = solution.budget
+            task = Task(fn, (parsed,), budget.time, budget.memory)
+            outcome = run_in_subprocess(task, on_started if part == remaining[-1] else None)
+            result = result._replace(
+                answer=outcome.result,
+                elapsed_ns=outcome.elapsed_ns,
+                status=outcome.status,
+                error=outcome.error,
+            )
+
+        if cache is not None and result.status == "ok" and result.answer is not None:
+            cache.put(keys[part], CachedAnswer(result.answer, result.elapsed_ns, parse_ns))
+
+        results[part] = result
+
+    return [results[part] for part in parts]
+
+
+def run_tests(solution: Solution, part: int, parallel: bool = True) -> list[TestResult]:
+    cases = solution.test_cases[part - 1]
+    return run_test_cases(
+        solution.part(part), solution.parse, cases, solution.budget, parallel, solution.input_mode
+    )
@@ -0,0 +1,25 @@
+import pathlib
+import random
+
+from tools.common import GenerateFn
+
+GeneratedDir = pathlib.Path(".generated")
+
+
+def generated_file(year: int, day: int, scale: int, seed: int) -> pathlib.Path:
+    # same year/dayNN layout as solutions/, so the puzzle can be told from the path
+    return GeneratedDir / str(year) / f"day{day:02d}" / f"scale{scale}-seed{seed}.txt"
+
+
+def write_input(generate: GenerateFn, path: pathlib.Path, scale: int, seed: int) -> int:
+    """Stream a generated input to `path` chunk by chunk, returning its size in bytes."""
+    rng = random.Random(seed)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp = path.with_name(f".{path.name}.tmp")
+    with tmp.open("w") as f:
+        for chunk in generate(scale, rng):
+            f.write(chunk)
+
+    tmp.replace(path)
+    return path.stat().st_size
@@ -0,0 +1,91 @@
+from typing import Iterator
+
+from tools.common import Point
+
+
+class Grid:
+    """A rectangular grid of single byte cells, stored row by row in one flat `bytearray`.
+
+    Cells are addressed by their index into `cells`, moving to a neighbour is adding one of
+    `offsets4` or `offsets8`. A grid parsed with a `border` is surrounded by `pad` cells of it,
+    so neighbours of the edge cells can be read without checking bounds first.
+    """
+
+    def __init__(self, cells: bytearray, width: int, height: int, pad: int = 0) -> None:
+        self.cells = cells
+        self.width = width
+        self.height = height
+        self.pad = pad
+        self.stride = width + 2 * pad
+
+        # clockwise from up, so turning right is moving to the next offset
+        s = self.stride
+        self.offsets4 = (-s, 1, s, -1)
+        self.offsets8 = (-s, -s + 1, 1, s + 1, s, s - 1, -1, -s - 1)
+
+    @classmethod
+    def parse(
+        cls,
+        data: str | bytes | memoryview,
+        border: str | None = None,
+        pad: int = 1,
+    ) -> "Grid":
+        raw = data.encode() if isinstance(data, str) else bytes(data)
+        rows = raw.strip().splitlines()
+
+        width = len(rows[0])
+        if any(len(row) != width for row in rows):
+            raise ValueError("Every row of a grid must be the same width")
+
+        if border is None:
+            return cls(bytearray(b"".join(rows)), width, len(rows))
+
+        side = border.encode() * pad
+        edge = border.encode() * (width + 2 * pad) * pad
+        cells = bytearray(edge + side + (side + side).join(rows) + side + edge)
+        return cls(cells, width, len(rows), pad)
+
+    def index(self, x: int, y: int) -> int:
+        return (y + self.pad) * self.stride + x + self.pad
+
+    def point(self, i: int) -> Point:
+        y, x = divmod(i, self.stride)
+        return x - self.pad, y - self.pad
+
+    def contains(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get(self, x: int, y: int, default: int | None = None) -> int | None:
+        return self.cells[self.index(x, y)] if self.contains(x, y) else default
+
+    def __getitem__(self, i: int) -> int:
+        return self.cells[i]
+
+    def __setitem__(self, i: int, value: int) -> None:
+        self.cells[i] = value
+
+    def find(self, value: int) -> int:
+        return self.cells.find(value)
+
+    def find_all(self, value: int) -> list[int]:
+        """The index of every cell holding `value`, the scanning happens in C."""
+        found = []
+        i = self.cells.find(value)
+        while i != -1:
+            found.append(i)
+            i = self.cells.find(value, i + 1)
+
+        return found
+
+    def indices(self) -> Iterator[int]:
+        """The index of every cell, leaving out the border."""
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def copy(self) -> "Grid":
+        return Grid(self.cells.copy(), self.width, self.height, self.pad)
+
+    def __str__(self) -> str:
+        starts = (self.index(0, y) for y in range(self.height))
+        return "\n".join(self.cells[i : i + self.width].decode() for i in starts)
@@ -0,0 +1,155 @@
+import hashlib
+import json
+import math
+import pathlib
+import platform
+from datetime import datetime
+from typing import NamedTuple
+
+HistoryFile = pathlib.Path(".bench_history.jsonl")
+
+SIGNIFICANCE = 0.01
+MIN_SLOWDOWN = 1.05
+
+# the baseline pools this many of the latest runs, so one noisy run can't move it far
+BASELINE_RUNS = 5
+
+
+class BenchRecord(NamedTuple):
+    year: int
+    day: int
+    part: int
+    source_hash: str
+    input_hash: str
+    python: str
+    timestamp: str
+    samples: list[int]
+
+    def same_workload(self, other: "BenchRecord") -> bool:
+        return (self.year, self.day, self.part, self.input_hash, self.python) == (
+            other.year,
+            other.day,
+            other.part,
+            other.input_hash,
+            other.python,
+        )
+
+
+class Comparison(NamedTuple):
+    baseline: BenchRecord
+    current: BenchRecord
+    ratio: float
+    p_value: float
+
+    @property
+    def regressed(self) -> bool:
+        return self.p_value < SIGNIFICANCE and self.ratio > MIN_SLOWDOWN
+
+
+def file_hash(path: pathlib.Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def puzzle_from_path(path: pathlib.Path) -> tuple[int, int]:
+    folder = path.absolute().parent
+    return int(folder.parent.name), int(folder.name.removeprefix("day"))
+
+
+def create_record(
+    solution_file: pathlib.Path,
+    input_file: pathlib.Path,
+    part: int,
+    samples: list[int],
+) -> BenchRecord:
+    year, day = puzzle_from_path(solution_file)
+
+    return BenchRecord(
+        year=year,
+        day=day,
+        part=part,
+        source_hash=file_hash(solution_file),
+        input_hash=file_hash(input_file),
+        python=platform.python_version(),
+        timestamp=datetime.now().isoformat(timespec="seconds"),
+        samples=samples,
+    )
+
+
+def load_records() -> list[BenchRecord]:
+    if not HistoryFile.exists():
+        return []
+
+    with HistoryFile.open() as f:
+        return [BenchRecord(**json.loads(line)) for line in f if line.strip()]
+
+
+def save_record(record: BenchRecord) -> None:
+    with HistoryFile.open("a") as f:
+        f.write(json.dumps(record._asdict()) + "\n")
+
+
+def find_baseline(record: BenchRecord) -> BenchRecord | None:
+    """The samples of the latest recorded runs of the same workload, pooled into one record."""
+    previous = [r for r in load_records() if r.same_workload(record)][-BASELINE_RUNS:]
+    if not previous:
+        return None
+
+    samples = [sample for r in previous for sample in r.samples]
+    return previous[0]._replace(samples=samples)
+
+
+def mann_whitney_p(baseline: list[int], current: list[int]) -> float:
+    """One sided p-value that `current` is slower than `baseline`."""
+    n1, n2 = len(baseline), len(current)
+    if not n1 or not n2:
+        return 1.0
+
+    ranked = sorted([(v, 0) for v in baseline] + [(v, 1) for v in current])
+    ranks = [0.0] * len(ranked)
+
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+
+        i = j + 1
+
+    rank_sum = sum(r for r, (_, group) in zip(ranks, ranked) if group == 1)
+    u = rank_sum - n2 * (n2 + 1) / 2
+
+    mean = n1 * n2 / 2
+    sd = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    if sd == 0:
+        return 1.0
+
+    z = (u - mean) / sd
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(baseline: BenchRecord, current: BenchRecord) -> Comparison:
+    # statistics pulls in fractions and decimal, the cache only needs file_hash from here
+    import statistics
+
+    ratio = statistics.median(current.samples) / statistics.median(baseline.samples)
+    p_value = mann_whitney_p(baseline.samples, current.samples)
+
+    return Comparison(baseline, current, ratio, p_value)
+
+
+def record_run(record: BenchRecord, accept: bool = False) -> Comparison | None:
+    """Compare a run to its baseline, a regression is only recorded when it is accepted.
+
+    Otherwise a slower run would become part of the baseline it is compared against next time.
+    """
+    baseline = find_baseline(record)
+    result = compare(baseline, record) if baseline else None
+
+    if accept or result is None or not result.regressed:
+        save_record(record)
+
+    return result
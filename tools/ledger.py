@@ -0,0 +1,144 @@
+import json
+import pathlib
+import time
+from datetime import datetime
+from datetime import timedelta
+from typing import Callable
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+
+from tools.store import account_id
+from tools.utils import Hint
+from tools.utils import parse_verdict
+from tools.utils import post_answer
+from tools.utils import Status
+from tools.utils import Verdict
+
+if TYPE_CHECKING:
+    import httpx
+
+LedgerFile = pathlib.Path(".submissions.jsonl")
+
+# when the site asks us to wait but doesn't say for how long
+DEFAULT_WAIT = 60
+MAX_ATTEMPTS = 3
+
+
+class Submission(NamedTuple):
+    account: str
+    year: int
+    day: int
+    part: int
+    answer: str
+    status: Status
+    hint: Hint | None
+    wait: int | None
+    timestamp: str
+
+    @property
+    def time(self) -> datetime:
+        return datetime.fromisoformat(self.timestamp)
+
+
+class Refused(Exception):
+    pass
+
+
+def load_submissions(path: pathlib.Path = LedgerFile) -> list[Submission]:
+    if not path.exists():
+        return []
+
+    with path.open() as f:
+        return [Submission(**json.loads(line)) for line in f if line.strip()]
+
+
+def save_submission(submission: Submission, path: pathlib.Path = LedgerFile) -> None:
+    with path.open("a") as f:
+        f.write(json.dumps(submission._asdict()) + "\n")
+
+
+def _as_int(answer: str) -> int | None:
+    try:
+        return int(answer)
+    except ValueError:
+        return None
+
+
+def _hinted(submissions: list[Submission], hint: Hint) -> list[int]:
+    answers = [_as_int(s.answer) for s in submissions if s.hint == hint]
+    return [answer for answer in answers if answer is not None]
+
+
+def refusal(submissions: list[Submission], answer: str) -> str | None:
+    """Why `answer` is known to be wrong without asking, `submissions` are for its puzzle part."""
+    for s in submissions:
+        if s.status in ("Correct", "Already completed"):
+            return f"Already completed, {s.answer} was submitted at {s.timestamp}"
+
+        if s.status == "Incorrect" and s.answer == answer:
+            return f"{answer} was already rejected at {s.timestamp}"
+
+    if (value := _as_int(answer)) is None:
+        return None
+
+    if (too_low := _hinted(submissions, "too low")) and value <= max(too_low):
+        return f"{answer} is too low, {max(too_low)} already was"
+
+    if (too_high := _hinted(submissions, "too high")) and value >= min(too_high):
+        return f"{answer} is too high, {min(too_high)} already was"
+
+    return None
+
+
+def seconds_left(submissions: list[Submission]) -> float:
+    """How long until the site accepts another answer, `submissions` are for one puzzle."""
+    waits = [s.time + timedelta(seconds=s.wait) for s in submissions if s.wait is not None]
+    if not waits:
+        return 0.0
+
+    return max(0.0, (max(waits) - datetime.now()).total_seconds())
+
+
+def submit(
+    year: int,
+    day: int,
+    part: int,
+    answer: str,
+    token: str,
+    on_wait: Callable[[float], None] = time.sleep,
+    client: "httpx.Client | None" = None,
+) -> Verdict:
+    """Submit an answer unless the ledger already knows it's wrong, waiting out any lockout."""
+    account = account_id(token)
+    puzzle = [s for s in load_submissions() if (s.account, s.year, s.day) == (account, year, day)]
+
+    if reason := refusal([s for s in puzzle if s.part == part], answer):
+        raise Refused(reason)
+
+    for _ in range(MAX_ATTEMPTS):
+        if (left := seconds_left(puzzle)) > 0:
+            on_wait(left)
+
+        verdict = parse_verdict(post_answer(day, year, token, part, answer, client))
+        wait = verdict.wait
+        if verdict.status == "Please wait" and wait is None:
+            wait = DEFAULT_WAIT
+
+        submission = Submission(
+            account=account,
+            year=year,
+            day=day,
+            part=part,
+            answer=answer,
+            status=verdict.status,
+            hint=verdict.hint,
+            wait=wait,
+            timestamp=datetime.now().isoformat(timespec="seconds"),
+        )
+        save_submission(submission)
+        puzzle.append(submission)
+
+        if verdict.status != "Please wait":
+            return verdict
+
+    return verdict
@@ -0,0 +1,103 @@
+import pathlib
+import resource
+import sys
+import tracemalloc
+from types import FrameType
+from typing import Any
+from typing import Callable
+from typing import NamedTuple
+
+from rich.table import Table
+
+from tools.common import format_bytes
+
+# only snapshot once traced memory has grown this much past the previous snapshot
+MIN_SNAPSHOT_BYTES = 64 << 10
+SNAPSHOT_GROWTH = 1.25
+
+
+class MemoryReport(NamedTuple):
+    result: Any
+    peak_bytes: int
+    max_rss_bytes: int
+    top_sites: list[tracemalloc.Statistic]
+
+
+class _PeakTracker:
+    """Snapshot the traced allocations whenever a function returns at a new high."""
+
+    def __init__(self) -> None:
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.snapshot_size = MIN_SNAPSHOT_BYTES
+
+    def __call__(self, frame: FrameType, event: str, arg: Any) -> None:
+        if event != "return":
+            return
+
+        current, _ = tracemalloc.get_traced_memory()
+        if current < self.snapshot_size * SNAPSHOT_GROWTH:
+            return
+
+        self.snapshot = tracemalloc.take_snapshot()
+        self.snapshot_size = current
+
+
+def max_rss_bytes() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # kilobytes on linux, bytes on macOS
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def measure_memory(fn: Callable[[Any], Any], data: Any, limit: int = 10) -> MemoryReport:
+    tracker = _PeakTracker()
+    tracemalloc.start()
+
+    try:
+        sys.setprofile(tracker)
+        try:
+            result = fn(data)
+        finally:
+            sys.setprofile(None)
+
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracker.snapshot or tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+    top_sites = snapshot.statistics("lineno")[:limit]
+
+    return MemoryReport(result, peak, max_rss_bytes(), top_sites)
+
+
+def create_memory_table() -> Table:
+    table = Table(title="MEMORY", min_width=80, title_justify="left")
+    table.add_column("STEP")
+    table.add_column("PEAK TRACED", justify="right", style="cyan")
+    table.add_column("MAX RSS", justify="right", style="yellow")
+
+    return table
+
+
+def add_memory_row(table: Table, label: str, report: MemoryReport) -> None:
+    table.add_row(label, format_bytes(report.peak_bytes), format_bytes(report.max_rss_bytes))
+
+
+def create_allocation_table(label: str, report: MemoryReport) -> Table:
+    table = Table(title=f"TOP ALLOCATIONS ({label})", min_width=80, title_justify="left")
+    table.add_column("LINE")
+    table.add_column("SIZE", justify="right", style="cyan")
+    table.add_column("BLOCKS", justify="right")
+
+    for stat in report.top_sites:
+        frame = stat.traceback[0]
+        location = f"{pathlib.Path(frame.filename).name}:{frame.lineno}"
+        table.add_row(location, format_bytes(stat.size), str(stat.count))
+
+    return table
@@ -0,0 +1,174 @@
+import asyncio
+import contextlib
+import io
+import os
+import random
+import time
+from functools import partial
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import NamedTuple
+from typing import Sequence
+
+import httpx
+from rich.table import Table
+
+from tools.bench import BenchStats
+from tools.common import format_ns
+from tools.download import fetch
+from tools.download import MAX_CONCURRENCY
+from tools.download import MIN_INTERVAL
+from tools.download import RateLimiter
+from tools.server import running
+from tools.server import ServerConfig
+from tools.server import standin_answer
+from tools.server import StandInServer
+from tools.utils import fetch_input
+from tools.utils import get_headers
+from tools.utils import submit_answer
+from tools.utils import try_fetch_input
+
+YEAR = 2024
+TOKEN = "netbench"
+
+
+class NetResult(NamedTuple):
+    scenario: str
+    samples: list[int]
+    failures: int
+    requests: int
+    total_ns: int
+
+
+@contextlib.contextmanager
+def pointed_at(url: str) -> Iterator[None]:
+    previous = os.environ.get("AOC_BASE_URL")
+    os.environ["AOC_BASE_URL"] = url
+
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ["AOC_BASE_URL"]
+        else:
+            os.environ["AOC_BASE_URL"] = previous
+
+
+def day(i: int) -> int:
+    return i % 25 + 1
+
+
+def time_calls(
+    server: StandInServer, scenario: str, calls: Sequence[Callable[[], Any]]
+) -> NetResult:
+    """Time each call on its own, failures are counted but not timed."""
+    requests = server.stats["requests"]
+    samples = []
+    failures = 0
+
+    start = time.perf_counter_ns()
+    for call in calls:
+        call_start = time.perf_counter_ns()
+        try:
+            # try_fetch_input prints every failed attempt
+            with contextlib.redirect_stdout(io.StringIO()):
+                call()
+        except Exception:
+            failures += 1
+            continue
+
+        samples.append(time.perf_counter_ns() - call_start)
+
+    elapsed = time.perf_counter_ns() - start
+    return NetResult(scenario, samples, failures, server.stats["requests"] - requests, elapsed)
+
+
+async def _pooled_fetches(url: str, n: int) -> tuple[list[int], int]:
+    limiter = RateLimiter(MIN_INTERVAL)
+    rng = random.Random()
+    limits = httpx.Limits(
+        max_connections=MAX_CONCURRENCY,
+        max_keepalive_connections=MAX_CONCURRENCY,
+    )
+
+    async with httpx.AsyncClient(
+        base_url=url,
+        headers=get_headers(TOKEN),
+        limits=limits,
+        timeout=httpx.Timeout(10.0, pool=None),
+    ) as client:
+
+        async def timed_fetch(i: int) -> int | None:
+            start = time.perf_counter_ns()
+            try:
+                await fetch(client, limiter, f"/{YEAR}/day/{day(i)}/input", {}, rng)
+            except httpx.HTTPError:
+                return None
+
+            return time.perf_counter_ns() - start
+
+        results = await asyncio.gather(*map(timed_fetch, range(n)))
+
+    samples = [result for result in results if result is not None]
+    return samples, len(results) - len(samples)
+
+
+def time_pooled(server: StandInServer, n: int) -> NetResult:
+    requests = server.stats["requests"]
+
+    start = time.perf_counter_ns()
+    samples, failures = asyncio.run(_pooled_fetches(server.url, n))
+    elapsed = time.perf_counter_ns() - start
+
+    requests = server.stats["requests"] - requests
+    return NetResult("pooled fetch", samples, failures, requests, elapsed)
+
+
+def run_netbench(config: ServerConfig, n: int, retry_delay: int) -> list[NetResult]:
+    """Time the network paths of the cli against a local stand-in server."""
+    with running(config) as server, pointed_at(server.url):
+        fetches = [partial(fetch_input, day(i), YEAR, TOKEN) for i in range(n)]
+        retries = [
+            partial(try_fetch_input, day(i), YEAR, TOKEN, delay=retry_delay) for i in range(n)
+        ]
+        answers = [standin_answer(YEAR, day(i), TOKEN, 1) for i in range(n)]
+        submits = [partial(submit_answer, day(i), YEAR, TOKEN, 1, answers[i]) for i in range(n)]
+
+        return [
+            time_calls(server, "fetch_input", fetches),
+            time_calls(server, "try_fetch_input", retries),
+            time_calls(server, "submit_answer", submits),
+            time_pooled(server, n),
+        ]
+
+
+def create_netbench_table(config: ServerConfig) -> Table:
+    title = (
+        f"NETWORK BENCHMARK (latency {config.latency * 1000:.0f} ms, "
+        f"{config.error_rate:.0%} errors, {config.rate_limit_rate:.0%} rate limited)"
+    )
+    table = Table(title=title, min_width=80, title_justify="left")
+    table.add_column("SCENARIO")
+    table.add_column("CALLS", justify="right")
+    table.add_column("REQUESTS", justify="right")
+    table.add_column("FAILED", justify="right")
+    for column in ("MEDIAN", "P95", "TOTAL"):
+        table.add_column(column, justify="right", style="cyan")
+
+    return table
+
+
+def add_netbench_row(table: Table, result: NetResult) -> None:
+    stats = BenchStats(result.samples)
+    failed = f"[red]{result.failures}" if result.failures else "0"
+
+    table.add_row(
+        result.scenario,
+        str(len(result.samples) + result.failures),
+        str(result.requests),
+        failed,
+        format_ns(round(stats.median)) if result.samples else "",
+        format_ns(stats.p95) if result.samples else "",
+        format_ns(result.total_ns),
+    )
@@ -0,0 +1,53 @@
+import cProfile
+import pathlib
+import pstats
+from typing import NamedTuple
+
+from rich.table import Table
+
+from tools.engine import read_input
+from tools.engine import Solution
+
+
+class ProfileResult(NamedTuple):
+    answer: int | str
+    stats: pstats.Stats
+    stats_file: pathlib.Path
+
+
+def profile_part(solution: Solution, part: int) -> ProfileResult:
+    input_data = read_input(solution.input_file, solution.input_mode)
+    fn = solution.part(part)
+
+    with cProfile.Profile() as profiler:
+        parsed, _ = solution.parse_input(input_data)
+        answer = fn(parsed)
+
+    stats_file = solution.input_file.parent / f"part{part}.pstats"
+    profiler.dump_stats(stats_file)
+
+    return ProfileResult(answer, pstats.Stats(profiler), stats_file)
+
+
+def _location(filename: str, line: int, name: str) -> str:
+    if filename == "~":
+        return name
+
+    return f"{pathlib.Path(filename).name}:{line}({name})"
+
+
+def create_profile_table(stats: pstats.Stats, limit: int = 20) -> Table:
+    table = Table(title="PROFILE", min_width=80, title_justify="left")
+    table.add_column("FUNCTION")
+    table.add_column("CALLS", justify="right")
+    table.add_column("TOTTIME", justify="right", style="cyan")
+    table.add_column("CUMTIME", justify="right", style="yellow")
+
+    entries = stats.stats.items()  # type: ignore[attr-defined]
+    by_cumulative = sorted(entries, key=lambda item: item[1][3], reverse=True)
+
+    for (filename, line, name), (cc, nc, tt, ct, _) in by_cumulative[:limit]:
+        calls = str(nc) if cc == nc else f"{nc}/{cc}"
+        table.add_row(_location(filename, line, name), calls, f"{tt:.4f}", f"{ct:.4f}")
+
+    return table
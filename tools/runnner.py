@@ -1,16 +1,40 @@
 import argparse
+import functools
+import inspect
 from pathlib import Path
-from typing import Callable
+from typing import Any
 from typing import Sequence
-
-from rich.console import Console
-from rich.table import Table
-
-console = Console()
-PartFn = Callable[[str], int | str]
-
-TestCase = tuple[str, int | str]
-TestCases = tuple[list[TestCase], list[TestCase]]
+from typing import TYPE_CHECKING
+
+from tools.cache import AnswerCache
+from tools.common import Budget
+from tools.common import DEFAULT_BUDGET
+from tools.common import format_ns
+from tools.common import InputData
+from tools.common import InputMode
+from tools.common import ParseFn
+from tools.common import PartFn
+from tools.common import TestCases
+from tools.engine import load_input
+from tools.engine import read_input
+from tools.engine import run_parts
+from tools.engine import Solution
+from tools.history import puzzle_from_path
+from tools.store import restore_input
+from tools.testcases import run_test_cases
+from tools.testcases import TestResult
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+
+# rich is only imported once there is something to render, most runs just print an int
+@functools.cache
+def get_console() -> "Console":
+    from rich.console import Console
+
+    return Console()
 
 
 def aoc_runner(
@@ -19,40 +43,199 @@ def aoc_runner(
     part2: PartFn,
     input_file: Path,
     test_cases: TestCases,
+    parse: ParseFn | None = None,
+    budget: Budget = DEFAULT_BUDGET,
+    input_mode: InputMode = "text",
 ) -> int:
+    """Run a solution.
+
+    If `parse` is given it is called once per input and the part functions receive its
+    result instead of the raw input string. Part functions must not mutate the parsed input,
+    it is shared between both parts and every benchmark run.
+
+    Each part and test case runs in a child process that is killed once it goes over the
+    `budget` time limit or fails to allocate past its memory limit.
+
+    With `input_mode="bytes"` the parse or part functions get a read-only memoryview of the
+    memory-mapped input instead of a str. With "lines" or "records" they get an iterable of
+    the lines, or of the blank line separated records, that reads the file as it goes so
+    inputs larger than memory can be folded in constant space. See `engine.read_input`.
+
+    Answers are cached by the input and the source of the part and everything it references,
+    as is the parsed input, pass `--no-cache` to run everything anyway.
+    """
     parser = argparse.ArgumentParser()
-    parser.add_argument("-p", "--part", type=int, default=1)
+    parser.add_argument("-p", "--part", type=int, choices=(1, 2), action="append")
     parser.add_argument("-t", "--test", action="store_true")
+    parser.add_argument("--timeout", type=float, help="Time limit in seconds")
+    parser.add_argument("--memory-limit", type=int, help="Memory limit in MiB")
+    parser.add_argument("--time", action="store_true")
+    parser.add_argument("--mem", action="store_true")
+    parser.add_argument("--bench", action="store_true")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached answers")
+    parser.add_argument("--input", type=Path, help="Use this input file, e.g. from `aoc gen`")
     args = parser.parse_args(argv)
 
-    fn = {1: part1, 2: part2}[args.part]
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    parts = args.part or [1]
+    fns = {1: part1, 2: part2}
+
+    if args.timeout:
+        budget = budget._replace(time=args.timeout)
+
+    if args.memory_limit:
+        budget = budget._replace(memory=args.memory_limit << 20)
 
     if args.test:
-        table = create_test_result_table()
+        for part in parts:
+            table = create_test_result_table()
+
+            cases = test_cases[part - 1]
+            for result in run_test_cases(fns[part], parse, cases, budget, input_mode=input_mode):
+                add_row(table, result)
 
-        for i, (test_data, expected) in enumerate(test_cases[args.part - 1], 1):
-            result = fn(test_data)
-            add_row(table, i, result, expected)
+            get_console().print(table)
 
-        console.print(table)
         return 0
 
-    input_data = input_file.read_text().strip()
-    print(fn(input_data))
+    try:
+        year, day = puzzle_from_path(input_file)
+    except ValueError:
+        # an INPUT_FILE outside the year/dayNN layout can't be found in the store
+        year, day = 0, 0
+    else:
+        if not args.input:
+            restore_input(year, day, input_file)
+
+    if args.input:
+        input_file = args.input
+
+    input_data = read_input(input_file, input_mode)
+
+    if args.mem:
+        report_memory(fns, parts, input_data, parse)
+        return 0
+
+    solution = Solution(year, day, part1, part2, input_file, test_cases, parse, budget, input_mode)
+
+    if args.bench:
+        from tools.bench import add_bench_row
+        from tools.bench import benchmark
+        from tools.bench import create_bench_table
+        from tools.history import create_record
+        from tools.history import record_run
+
+        parsed, _ = load_input(solution, use_cache=not args.no_cache)
+
+        table = create_bench_table()
+        if parse:
+            add_bench_row(table, "parse", benchmark(parse, input_data, args.warmup, args.repeat))
+
+        for part in parts:
+            fn = fns[part]
+            stats = benchmark(fn, parsed, args.warmup, args.repeat)
+            add_bench_row(table, str(part), stats)
+
+            solution_file = Path(inspect.getfile(fn))
+            record_run(create_record(solution_file, input_file, part, stats.samples))
+
+        get_console().print(table)
+        return 0
+
+    cache = None if args.no_cache else AnswerCache.load()
+    results = run_parts(solution, parts, cache=cache)
+    if cache is not None:
+        cache.save()
+
+    for run in results:
+        if run.status != "ok":
+            get_console().print(f"[red]{run.status.upper()}[/]: {run.error}")
+            return 1
+
+        print(run.answer)
+
+    if args.time:
+        table = create_timing_table()
+        if parse and (parse_ns := [r.parse_ns for r in results if not r.cached]):
+            table.add_row("parse", format_ns(parse_ns[0]))
+
+        for run in results:
+            label = f"part {run.part}" + (" (cached)" if run.cached else "")
+            table.add_row(label, format_ns(run.elapsed_ns))
+
+        get_console().print(table)
 
     return 0
 
 
-def create_test_result_table() -> Table:
+def report_memory(
+    fns: dict[int, PartFn],
+    parts: list[int],
+    input_data: InputData,
+    parse: ParseFn | None,
+) -> None:
+    from tools.memory import add_memory_row
+    from tools.memory import create_allocation_table
+    from tools.memory import create_memory_table
+    from tools.memory import measure_memory
+
+    table = create_memory_table()
+    reports = []
+
+    parsed: Any = input_data
+    if parse:
+        report = measure_memory(parse, input_data)
+        parsed = report.result
+        reports.append(("parse", report))
+
+    for part in parts:
+        report = measure_memory(fns[part], parsed)
+        print(report.result)
+        reports.append((f"part {part}", report))
+
+    for label, report in reports:
+        add_memory_row(table, label, report)
+
+    console = get_console()
+    console.print(table)
+    for label, report in reports:
+        console.print(create_allocation_table(label, report))
+
+
+def create_timing_table() -> "Table":
+    from rich.table import Table
+
+    table = Table(title="TIMINGS", min_width=80, title_justify="left")
+    table.add_column("STEP")
+    table.add_column("TIME", justify="right", style="cyan")
+
+    return table
+
+
+def create_test_result_table() -> "Table":
+    from rich.table import Table
+
     table = Table(title="TEST RESULTS", min_width=80, title_justify="left")
     table.add_column("TEST CASE")
     table.add_column("RESULT", style="cyan")
     table.add_column("EXPECTED", style="yellow")
+    table.add_column("TIME", justify="right")
     table.add_column("PASS")
 
     return table
 
 
-def add_row(table: Table, tc: int, actual: int | str, expected: int | str) -> None:
-    pass_str = "[green]PASS" if actual == expected else "[red]FAIL"
-    table.add_row(str(tc), str(actual), str(expected), pass_str)
+def add_row(table: "Table", result: TestResult) -> None:
+    if result.status != "ok":
+        pass_str = f"[red]{result.status.upper()}"
+        answer = result.error.splitlines()[-1]
+    else:
+        pass_str = "[green]PASS" if result.passed else "[red]FAIL"
+        answer = str(result.answer)
+
+    elapsed = format_ns(result.elapsed_ns)
+    table.add_row(str(result.case), answer, str(result.expected), elapsed, pass_str)
@@ -0,0 +1,107 @@
+import math
+import pathlib
+import statistics
+import time
+from typing import Callable
+from typing import NamedTuple
+
+from rich.table import Table
+
+from tools.common import format_ns
+from tools.engine import read_input
+from tools.engine import Solution
+
+# a run is repeated until it has taken this long, to smooth out the small sizes
+MIN_TOTAL_NS = 200_000_000
+MAX_RUNS = 5
+
+# log of each model's growth, so the exponential one doesn't overflow at larger n
+MODELS: dict[str, Callable[[int], float]] = {
+    "O(n)": lambda n: math.log(n),
+    "O(n log n)": lambda n: math.log(n * math.log2(max(n, 2))),
+    "O(n²)": lambda n: 2 * math.log(n),
+    "O(2ⁿ)": lambda n: n * math.log(2),
+}
+
+
+class ScalePoint(NamedTuple):
+    n: int
+    elapsed_ns: int
+
+
+class Fit(NamedTuple):
+    model: str
+    log_coefficient: float
+    rms_error: float
+
+    def log_predict(self, n: int) -> float:
+        return self.log_coefficient + MODELS[self.model](n)
+
+
+def sizes(start: int, factor: float, steps: int) -> list[int]:
+    ns = [max(1, round(start * factor**i)) for i in range(steps)]
+    return sorted(set(ns))
+
+
+def time_part(solution: Solution, part: int, input_file: pathlib.Path) -> int:
+    """The fastest of a few runs of `part` on the input, parsing is not included."""
+    input_data = read_input(input_file, solution.input_mode)
+    parsed, _ = solution.parse_input(input_data)
+    fn = solution.part(part)
+
+    samples: list[int] = []
+    while not samples or (sum(samples) < MIN_TOTAL_NS and len(samples) < MAX_RUNS):
+        start = time.perf_counter_ns()
+        fn(parsed)
+        samples.append(time.perf_counter_ns() - start)
+
+    return min(samples)
+
+
+def fit_models(points: list[ScalePoint]) -> list[Fit]:
+    """Least squares fit of each model in log space, best fit first."""
+    fits = []
+    log_times = [math.log(max(p.elapsed_ns, 1)) for p in points]
+
+    for model, log_growth in MODELS.items():
+        residuals = [t - log_growth(p.n) for p, t in zip(points, log_times)]
+        log_coefficient = statistics.fmean(residuals)
+        rms = math.sqrt(statistics.fmean((r - log_coefficient) ** 2 for r in residuals))
+        fits.append(Fit(model, log_coefficient, rms))
+
+    return sorted(fits, key=lambda fit: fit.rms_error)
+
+
+def format_log_ns(log_ns: float) -> str:
+    if log_ns > math.log(1e12):
+        return f"{math.exp(min(log_ns, 700)) / 1e9:.2g} s"
+
+    return format_ns(round(math.exp(log_ns)))
+
+
+def create_scaling_table(part: int) -> Table:
+    table = Table(title=f"SCALING (part {part})", min_width=80, title_justify="left")
+    table.add_column("N", justify="right")
+    table.add_column("TIME", justify="right", style="cyan")
+    table.add_column("RATIO", justify="right", style="yellow")
+
+    return table
+
+
+def add_scaling_row(table: Table, point: ScalePoint, previous: ScalePoint | None) -> None:
+    ratio = f"{point.elapsed_ns / max(previous.elapsed_ns, 1):.2f}x" if previous else ""
+    table.add_row(str(point.n), format_ns(point.elapsed_ns), ratio)
+
+
+def create_fit_table(fits: list[Fit], projected_n: int) -> Table:
+    table = Table(title="BEST FIT", min_width=80, title_justify="left")
+    table.add_column("MODEL")
+    table.add_column("RMS LOG ERROR", justify="right", style="cyan")
+    table.add_column(f"PROJECTED AT N={projected_n}", justify="right", style="yellow")
+
+    for i, fit in enumerate(fits):
+        model = f"[bold green]{fit.model}" if i == 0 else fit.model
+        projected = format_log_ns(fit.log_predict(projected_n))
+        table.add_row(model, f"{fit.rms_error:.3f}", projected)
+
+    return table
@@ -0,0 +1,215 @@
+import contextlib
+import random
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Iterator
+from typing import NamedTuple
+from urllib.parse import parse_qs
+
+from tools.utils import ALREADY_COMPLETED
+from tools.utils import CORRECT
+from tools.utils import INCORRECT
+from tools.utils import PLEASE_WAIT
+from tools.utils import TOO_HIGH
+from tools.utils import TOO_LOW
+from tools.utils import unlock_time
+
+ROUTE = re.compile(r"^/(\d+)/day/(\d+)/(input|answer)$")
+
+# when inputs were "published", for conditional requests
+LAST_MODIFIED = "Sun, 01 Dec 2024 05:00:00 GMT"
+
+PAGE = "<html><body><main><article><p>{message}</p></article></main></body></html>"
+
+LOGIN_REQUIRED = "Puzzle inputs differ by user.  Please log in to get your puzzle input."
+
+
+class ServerConfig(NamedTuple):
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: int = 1
+    wrong_answer_wait: float = 60.0
+    # how far behind the real unlock the server starts serving an input
+    unlock_delay: float = 0.0
+    seed: int = 0
+
+
+def standin_numbers(year: int, day: int, session: str) -> list[int]:
+    rng = random.Random(f"{year}/{day}/{session}")
+    return [rng.randint(1, 1_000_000) for _ in range(1000)]
+
+
+def standin_input(year: int, day: int, session: str) -> str:
+    return "\n".join(map(str, standin_numbers(year, day, session))) + "\n"
+
+
+def standin_answer(year: int, day: int, session: str, part: int) -> str:
+    """Part 1 is the sum of the input, part 2 its largest number."""
+    numbers = standin_numbers(year, day, session)
+    return str(sum(numbers) if part == 1 else max(numbers))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "StandInServer"
+    body = ""
+
+    # keep-alive, so clients that pool connections get to reuse them
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def respond(self, status: int, body: str = "", headers: dict[str, str] | None = None) -> None:
+        data = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+
+        self.end_headers()
+        self.wfile.write(data)
+
+    def session(self) -> str | None:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return cookie["session"].value if "session" in cookie else None
+
+    def fault(self) -> bool:
+        """Simulate the network and the server having a bad day, True if it responded."""
+        config = self.server.config
+        latency, roll = self.server.roll()
+        time.sleep(latency)
+
+        if roll < config.rate_limit_rate:
+            self.server.count("rate limited")
+            self.respond(429, headers={"Retry-After": str(config.retry_after)})
+            return True
+
+        if roll < config.rate_limit_rate + config.error_rate:
+            self.server.count("errors")
+            self.respond(500, "Internal Server Error")
+            return True
+
+        return False
+
+    def route(self, kind: str) -> tuple[int, int, str] | None:
+        self.server.count("requests")
+        body_length = int(self.headers.get("Content-Length", 0))
+        self.body = self.rfile.read(body_length).decode()
+
+        if self.fault():
+            return None
+
+        match = ROUTE.match(self.path)
+        if not match or match[3] != kind:
+            self.respond(404, "404 Not Found")
+            return None
+
+        session = self.session()
+        if session is None:
+            self.respond(400, LOGIN_REQUIRED)
+            return None
+
+        return int(match[1]), int(match[2]), session
+
+    def do_GET(self) -> None:
+        if (route := self.route("input")) is None:
+            return
+
+        year, day, _ = route
+        unlock = unlock_time(year, day) + timedelta(seconds=self.server.config.unlock_delay)
+        if datetime.now(timezone.utc) < unlock:
+            self.respond(404, "Please don't repeatedly request this endpoint before it unlocks!")
+            return
+
+        if self.headers.get("If-Modified-Since") == LAST_MODIFIED:
+            self.respond(304)
+            return
+
+        self.respond(200, standin_input(*route), {"Last-Modified": LAST_MODIFIED})
+
+    def do_POST(self) -> None:
+        if (route := self.route("answer")) is None:
+            return
+
+        year, day, session = route
+        form = parse_qs(self.body)
+        part = int(form.get("level", ["1"])[0])
+        answer = form.get("answer", [""])[0]
+
+        message = self.server.submit(year, day, session, part, answer)
+        self.respond(200, PAGE.format(message=message))
+
+
+class StandInServer(ThreadingHTTPServer):
+    """A local stand-in for adventofcode.com, serving made up inputs and answers."""
+
+    daemon_threads = True
+
+    def __init__(self, config: ServerConfig, port: int = 0) -> None:
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.stats: Counter[str] = Counter()
+        self.solved: set[tuple[int, int, str, int]] = set()
+        self.last_wrong: dict[str, float] = {}
+        self.lock = threading.Lock()
+        super().__init__(("127.0.0.1", port), _Handler)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def roll(self) -> tuple[float, float]:
+        with self.lock:
+            latency = self.config.latency + self.rng.uniform(0, self.config.jitter)
+            return latency, self.rng.random()
+
+    def count(self, stat: str) -> None:
+        with self.lock:
+            self.stats[stat] += 1
+
+    def submit(self, year: int, day: int, session: str, part: int, answer: str) -> str:
+        with self.lock:
+            if (year, day, session, part) in self.solved:
+                return f"You don't seem to be solving the right level.  {ALREADY_COMPLETED}"
+
+            last_wrong = self.last_wrong.get(session)
+            wait = self.config.wrong_answer_wait
+            if last_wrong is not None and (left := last_wrong + wait - time.monotonic()) > 0:
+                return f"{PLEASE_WAIT}. You have {left:.0f}s left to wait."
+
+            expected = standin_answer(year, day, session, part)
+            if answer == expected:
+                self.solved.add((year, day, session, part))
+                return f"{CORRECT} You got rank 1 on this star's leaderboard."
+
+            self.last_wrong[session] = time.monotonic()
+            hint = ""
+            if answer.isdigit():
+                hint = f"; {TOO_HIGH if int(answer) > int(expected) else TOO_LOW}"
+
+            return f"{INCORRECT}{hint}.  Please wait one minute before trying again."
+
+
+@contextlib.contextmanager
+def running(config: ServerConfig) -> Iterator[StandInServer]:
+    """Serve from a background thread on a free port, for as long as the context is open."""
+    with StandInServer(config) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            yield server
+        finally:
+            server.shutdown()
+            thread.join()
@@ -0,0 +1,98 @@
+import re
+import statistics
+import subprocess
+import sys
+from typing import NamedTuple
+
+from rich.table import Table
+
+from tools.common import format_ns
+
+# cumulative import time allowed for each entry point, in milliseconds
+BUDGETS_MS = {
+    "tools.cli": 150,
+    "tools.runnner": 100,
+}
+
+IMPORT_TIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+class ImportTime(NamedTuple):
+    module: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+class Startup(NamedTuple):
+    module: str
+    total_us: int
+    children: list[ImportTime]
+
+
+def parse_import_times(output: str) -> list[ImportTime]:
+    times = []
+    for match in IMPORT_TIME.finditer(output):
+        self_us, cumulative_us, indent, module = match.groups()
+        times.append(ImportTime(module, len(indent) // 2, int(self_us), int(cumulative_us)))
+
+    return times
+
+
+def direct_imports(times: list[ImportTime], module: str) -> Startup:
+    """The time of `module` and of each of the imports it triggered itself."""
+    children: list[ImportTime] = []
+
+    # children are reported before their parent, anything already imported by site is missing
+    for entry in times:
+        if entry.depth == 0 and entry.module == module:
+            return Startup(module, entry.cumulative_us, children)
+
+        if entry.depth == 0:
+            children = []
+        elif entry.depth == 1:
+            children.append(entry)
+
+    raise ValueError(f"{module} not found in the import times")
+
+
+def measure_startup(module: str, runs: int = 5) -> Startup:
+    """The run with the median import time of `module`, each in a fresh interpreter."""
+    startups = []
+    for _ in range(runs):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        startups.append(direct_imports(parse_import_times(process.stderr), module))
+
+    median = statistics.median_low(startup.total_us for startup in startups)
+    return next(startup for startup in startups if startup.total_us == median)
+
+
+def create_startup_table(startup: Startup, budget_ms: float, top: int) -> Table:
+    status = "[green]OK" if startup.total_us <= budget_ms * 1000 else "[bold red]OVER BUDGET"
+    table = Table(
+        title=f"STARTUP ({startup.module}: {format_ns(startup.total_us * 1000)} of "
+        f"{format_ns(round(budget_ms * 1_000_000))}, {status}[/])",
+        min_width=80,
+        title_justify="left",
+    )
+    table.add_column("IMPORT")
+    table.add_column("SELF", justify="right", style="yellow")
+    table.add_column("CUMULATIVE", justify="right", style="cyan")
+    table.add_column("SHARE", justify="right")
+
+    children = sorted(startup.children, key=lambda entry: entry.cumulative_us, reverse=True)
+    for entry in children[:top]:
+        share = entry.cumulative_us / max(startup.total_us, 1)
+        table.add_row(
+            entry.module,
+            format_ns(entry.self_us * 1000),
+            format_ns(entry.cumulative_us * 1000),
+            f"{share:.0%}",
+        )
+
+    return table
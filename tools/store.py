@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+import pathlib
+
+StoreDir = pathlib.Path(os.environ.get("XDG_CACHE_HOME", pathlib.Path.home() / ".cache")) / "aoc"
+InputsDir = StoreDir / "inputs"
+IndexFile = InputsDir / "index.json"
+
+
+def account_id(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+def current_account() -> str | None:
+    # tools.utils pulls in typer, which the runner doesn't otherwise need
+    from tools.utils import read_token
+
+    try:
+        return account_id(read_token())
+    except FileNotFoundError:
+        return None
+
+
+def load_index() -> dict[str, str]:
+    if not IndexFile.exists():
+        return {}
+
+    index: dict[str, str] = json.loads(IndexFile.read_text())
+    return index
+
+
+def _index_key(year: int, day: int, account: str) -> str:
+    return f"{year}/{day}/{account}"
+
+
+def _write_atomic(path: pathlib.Path, data: bytes) -> None:
+    # other checkouts may be reading or writing the store at the same time
+    tmp = path.with_name(f".{path.name}.{os.getpid()}")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def put(year: int, day: int, account: str, data: str) -> pathlib.Path:
+    """Add an input to the store, returning the path of its blob."""
+    raw = data.encode()
+    blob = InputsDir / f"{hashlib.sha256(raw).hexdigest()}.txt"
+
+    InputsDir.mkdir(parents=True, exist_ok=True)
+    if not blob.exists():
+        _write_atomic(blob, raw)
+
+    index = load_index()
+    index[_index_key(year, day, account)] = blob.name
+    _write_atomic(IndexFile, json.dumps(index, indent=2, sort_keys=True).encode())
+
+    return blob
+
+
+def find(year: int, day: int, account: str | None) -> pathlib.Path | None:
+    """The stored input for a puzzle, any account's if `account` is None and only one has it."""
+    index = load_index()
+
+    if account is not None:
+        names = [index.get(_index_key(year, day, account))]
+    else:
+        prefix = _index_key(year, day, "")
+        names = list({name for key, name in index.items() if key.startswith(prefix)})
+
+    if len(names) != 1 or names[0] is None:
+        return None
+
+    blob = InputsDir / names[0]
+    return blob if blob.exists() else None
+
+
+def link_input(blob: pathlib.Path, input_file: pathlib.Path) -> None:
+    input_file.unlink(missing_ok=True)
+
+    try:
+        input_file.symlink_to(blob)
+    except OSError:
+        input_file.write_bytes(blob.read_bytes())
+
+
+def restore_input(year: int, day: int, input_file: pathlib.Path) -> bool:
+    """Link a missing input file to the stored input, if there is one."""
+    if input_file.exists() or not input_file.parent.exists():
+        return input_file.exists()
+
+    blob = find(year, day, current_account())
+    if blob is None:
+        return False
+
+    link_input(blob, input_file)
+    return True
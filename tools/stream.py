@@ -0,0 +1,62 @@
+import io
+import pathlib
+from typing import Callable
+from typing import Iterator
+from typing import TextIO
+
+
+class Lines:
+    """The lines of an input, read lazily each time it is iterated.
+
+    Blank lines at the start and end are skipped, like `str.strip` would.
+    """
+
+    def __init__(self, open_stream: Callable[[], TextIO]) -> None:
+        self.open_stream = open_stream
+
+    @classmethod
+    def from_file(cls, path: pathlib.Path) -> "Lines":
+        return cls(path.open)
+
+    @classmethod
+    def from_text(cls, text: str) -> "Lines":
+        return cls(lambda: io.StringIO(text))
+
+    def __iter__(self) -> Iterator[str]:
+        blank: list[str] = []
+        started = False
+
+        # file iteration reads in buffered chunks, only one line is held at a time
+        with self.open_stream() as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if not line.strip():
+                    if started:
+                        blank.append(line)
+
+                    continue
+
+                yield from blank
+                blank.clear()
+                started = True
+                yield line
+
+
+class Records:
+    """The blank line separated records of an input, each as a list of its lines."""
+
+    def __init__(self, lines: Lines) -> None:
+        self.lines = lines
+
+    def __iter__(self) -> Iterator[list[str]]:
+        record: list[str] = []
+
+        for line in self.lines:
+            if line.strip():
+                record.append(line)
+            elif record:
+                yield record
+                record = []
+
+        if record:
+            yield record
@@ -0,0 +1,77 @@
+import time
+from typing import Any
+from typing import NamedTuple
+
+from tools.common import Budget
+from tools.common import DEFAULT_BUDGET
+from tools.common import InputData
+from tools.common import InputMode
+from tools.common import ParseFn
+from tools.common import PartFn
+from tools.common import TestCase
+from tools.stream import Lines
+from tools.stream import Records
+from tools.worker import run_concurrently
+from tools.worker import Status
+from tools.worker import Task
+
+
+class TestResult(NamedTuple):
+    case: int
+    answer: int | str | None
+    expected: int | str
+    elapsed_ns: int
+    status: Status = "ok"
+    error: str = ""
+
+    @property
+    def passed(self) -> bool:
+        return self.status == "ok" and self.answer == self.expected
+
+
+def solve(fn: PartFn, parse: ParseFn | None, input_data: InputData) -> int | str:
+    parsed: Any = parse(input_data) if parse else input_data
+    return fn(parsed)
+
+
+def case_data(test_data: str, input_mode: InputMode = "text") -> InputData:
+    if input_mode == "bytes":
+        # trimmed the same way as the input file
+        return memoryview(test_data.strip().encode())
+
+    if input_mode == "lines":
+        return Lines.from_text(test_data)
+
+    if input_mode == "records":
+        return Records(Lines.from_text(test_data))
+
+    return test_data
+
+
+def run_test_cases(
+    fn: PartFn,
+    parse: ParseFn | None,
+    cases: list[TestCase],
+    budget: Budget = DEFAULT_BUDGET,
+    parallel: bool = True,
+    input_mode: InputMode = "text",
+) -> list[TestResult]:
+    if not parallel:
+        results = []
+        for i, (test_data, expected) in enumerate(cases, 1):
+            start = time.perf_counter_ns()
+            answer = solve(fn, parse, case_data(test_data, input_mode))
+            results.append(TestResult(i, answer, expected, time.perf_counter_ns() - start))
+
+        return results
+
+    tasks = [
+        Task(solve, (fn, parse, case_data(test_data, input_mode)), budget.time, budget.memory)
+        for test_data, _ in cases
+    ]
+    outcomes = run_concurrently(tasks)
+
+    return [
+        TestResult(i, outcome.result, expected, outcome.elapsed_ns, outcome.status, outcome.error)
+        for i, ((_, expected), outcome) in enumerate(zip(cases, outcomes), 1)
+    ]
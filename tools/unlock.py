@@ -0,0 +1,80 @@
+import time
+from datetime import datetime
+from datetime import timezone
+from typing import Callable
+
+import httpx
+
+from tools.utils import days_in_year
+from tools.utils import unlock_time
+
+# long enough to resolve and connect, well inside the client's KEEPALIVE_EXPIRY
+WARM_AHEAD = 10.0
+
+# the input 404s until the site agrees it has unlocked, a few seconds of retries cover clock skew
+RETRY_DELAYS = (0.25, 0.25, 0.5, 0.5, 1.0, 1.0, 2.0, 2.0, 4.0)
+
+
+class UnlockError(Exception):
+    pass
+
+
+def next_puzzle(now: datetime | None = None) -> tuple[int, int]:
+    """The next puzzle to unlock after `now`."""
+    now = now or datetime.now(timezone.utc)
+
+    for day in range(1, days_in_year(now.year) + 1):
+        if unlock_time(now.year, day) > now:
+            return now.year, day
+
+    return now.year + 1, 1
+
+
+def seconds_until(when: datetime) -> float:
+    return (when - datetime.now(timezone.utc)).total_seconds()
+
+
+def sleep_until(when: datetime) -> None:
+    # wake up every minute to check the wall clock again, in case the machine was suspended
+    while (left := seconds_until(when)) > 0:
+        time.sleep(min(left, 60.0))
+
+
+def _try_fetch(client: httpx.Client, url: str) -> tuple[str | None, str]:
+    """The response text if it succeeded, otherwise why it didn't."""
+    try:
+        response = client.get(url)
+    except httpx.TransportError as e:
+        return None, str(e) or type(e).__name__
+
+    if response.is_success:
+        return response.text, ""
+
+    return None, f"{response.status_code} {response.reason_phrase}"
+
+
+def fetch_at_unlock(
+    client: httpx.Client,
+    year: int,
+    day: int,
+    on_retry: Callable[[str, float], None] | None = None,
+) -> str:
+    """Fetch the input as soon as it unlocks, retrying on a short and bounded schedule."""
+    url = f"/{year}/day/{day}/input"
+    sleep_until(unlock_time(year, day))
+
+    for delay in RETRY_DELAYS:
+        text, error = _try_fetch(client, url)
+        if text is not None:
+            return text
+
+        if on_retry is not None:
+            on_retry(error, delay)
+
+        time.sleep(delay)
+
+    text, error = _try_fetch(client, url)
+    if text is None:
+        raise UnlockError(f"Input still unavailable after {len(RETRY_DELAYS)} retries: {error}")
+
+    return text
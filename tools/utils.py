@@ -1,25 +1,41 @@
 from __future__ import annotations
 
+import json
+import os
 import pathlib
+import re
 import time
+from dataclasses import asdict
+from dataclasses import dataclass
 from datetime import datetime
+from datetime import timezone
 from typing import Literal
+from typing import NamedTuple
+from typing import TYPE_CHECKING
 
-import httpx
 import typer
-from pydantic import BaseModel
 from rich import print
 
+if TYPE_CHECKING:
+    import httpx
+
 CurrentPuzzleFile = pathlib.Path(".current_puzzle")
 
+BaseUrl = "https://adventofcode.com"
+
+# how long an idle connection is kept open for the next request
+KEEPALIVE_EXPIRY = 60.0
+
 
-class Puzzle(BaseModel):
+# a plain dataclass, pydantic alone would add ~40ms to the start up of every command
+@dataclass
+class Puzzle:
     day: int
     year: int
     part: int
 
     def save(self) -> None:
-        CurrentPuzzleFile.write_text(self.model_dump_json())
+        CurrentPuzzleFile.write_text(json.dumps(asdict(self)))
 
     def delete(self) -> None:
         CurrentPuzzleFile.unlink()
@@ -29,7 +45,7 @@ class Puzzle(BaseModel):
         if not CurrentPuzzleFile.exists():
             return None
 
-        return cls.model_validate_json(CurrentPuzzleFile.read_text())
+        return cls(**json.loads(CurrentPuzzleFile.read_text()))
 
 
 def get_year() -> int:
@@ -54,6 +70,15 @@ def days_until_december() -> int:
     return (dec1 - today).days
 
 
+def days_in_year(year: int) -> int:
+    return 25 if year < 2025 else 12
+
+
+def unlock_time(year: int, day: int) -> datetime:
+    # puzzles unlock at midnight EST
+    return datetime(year, 12, day, 5, tzinfo=timezone.utc)
+
+
 class PuzzleError(Exception):
     pass
 
@@ -120,8 +145,37 @@ def get_headers(token: str) -> dict[str, str]:
     }
 
 
+def base_url() -> str:
+    """The site to talk to, AOC_BASE_URL points it at e.g. `aoc serve` instead."""
+    return os.environ.get("AOC_BASE_URL", BaseUrl).rstrip("/")
+
+
+def create_client(token: str) -> httpx.Client:
+    """A client that keeps its connections alive, for more than one request per command."""
+    import httpx
+
+    # httpx drops idle connections after 5s by default, too soon for a warmed up connection
+    limits = httpx.Limits(keepalive_expiry=KEEPALIVE_EXPIRY)
+    return httpx.Client(
+        base_url=base_url(), headers=get_headers(token), limits=limits, timeout=10.0
+    )
+
+
+def warm_up(client: httpx.Client, year: int) -> None:
+    """Resolve the host and open a connection, so the next request can reuse it."""
+    import httpx
+
+    try:
+        client.get(f"/{year}")
+    except httpx.TransportError:
+        # only an optimisation, the real request will report a flaky network
+        pass
+
+
 def fetch_input(day: int, year: int, token: str) -> str:
-    url = f"https://adventofcode.com/{year}/day/{day}/input"
+    import httpx
+
+    url = f"{base_url()}/{year}/day/{day}/input"
     headers = get_headers(token)
     response = httpx.get(url, headers=headers).raise_for_status()
     return response.text
@@ -140,11 +194,23 @@ def try_fetch_input(day: int, year: int, token: str, attempts: int = 3, delay: i
 
 
 Status = Literal["Correct", "Incorrect", "Already completed", "Please wait"]
+Hint = Literal["too high", "too low"]
 
 CORRECT = "That's the right answer!"
 INCORRECT = "That's not the right answer"
 PLEASE_WAIT = "You gave an answer too recently"
 ALREADY_COMPLETED = "Did you already complete it?"
+TOO_HIGH = "your answer is too high"
+TOO_LOW = "your answer is too low"
+
+TIME_LEFT = re.compile(r"You have (?:(\d+)m )?(\d+)s left to wait")
+PENALTY = re.compile(r"wait (one|\d+) minutes? before trying again", re.IGNORECASE)
+
+
+class Verdict(NamedTuple):
+    status: Status
+    hint: Hint | None = None
+    wait: int | None = None
 
 
 def correct(response: str) -> bool:
@@ -163,8 +229,54 @@ def please_wait(response: str) -> bool:
     return PLEASE_WAIT in response
 
 
-def submit_answer(day: int, year: int, token: str, part: int, answer: str) -> Status:
-    url = f"https://adventofcode.com/{year}/day/{day}/answer"
+def answer_hint(response: str) -> Hint | None:
+    if TOO_HIGH in response:
+        return "too high"
+
+    if TOO_LOW in response:
+        return "too low"
+
+    return None
+
+
+def wait_seconds(response: str) -> int | None:
+    """How long until another answer is accepted, if the response says."""
+    if match := TIME_LEFT.search(response):
+        return int(match[1] or 0) * 60 + int(match[2])
+
+    if match := PENALTY.search(response):
+        return 60 if match[1] == "one" else int(match[1]) * 60
+
+    return None
+
+
+def parse_verdict(response: str) -> Verdict:
+    if correct(response):
+        return Verdict("Correct")
+
+    if incorrect(response):
+        return Verdict("Incorrect", answer_hint(response), wait_seconds(response))
+
+    if already_completed(response):
+        return Verdict("Already completed")
+
+    if please_wait(response):
+        return Verdict("Please wait", wait=wait_seconds(response))
+
+    raise Exception(f"Unknown response! {response}")
+
+
+def post_answer(
+    day: int,
+    year: int,
+    token: str,
+    part: int,
+    answer: str,
+    client: httpx.Client | None = None,
+) -> str:
+    import httpx
+
+    url = f"{base_url()}/{year}/day/{day}/answer"
     headers = get_headers(token)
 
     data = {
@@ -172,18 +284,10 @@ def submit_answer(day: int, year: int, token: str, part: int, answer: str) -> St
         "answer": answer,
     }
 
-    response = httpx.post(url, headers=headers, data=data).raise_for_status()
-
-    if correct(response.text):
-        return "Correct"
-
-    if incorrect(response.text):
-        return "Incorrect"
-
-    if already_completed(response.text):
-        return "Already completed"
+    post = client.post if client is not None else httpx.post
+    response = post(url, headers=headers, data=data).raise_for_status()
+    return response.text
 
-    if please_wait(response.text):
-        return "Please wait"
 
-    raise Exception(f"Unknown response! {response.text}")
+def submit_answer(day: int, year: int, token: str, part: int, answer: str) -> Status:
+    return parse_verdict(post_answer(day, year, token, part, answer)).status
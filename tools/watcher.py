@@ -0,0 +1,103 @@
+import multiprocessing
+import os
+import pathlib
+import signal
+import time
+from multiprocessing.process import BaseProcess
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+
+# a run writes the parse cache next to the solution, it mustn't trigger another run
+IGNORED = ("__pycache__", ".pstats", ".pyc", ".pickle")
+
+Snapshot = dict[pathlib.Path, int]
+
+
+def _files(path: pathlib.Path) -> Iterator[pathlib.Path]:
+    if path.is_file():
+        yield path
+        return
+
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [d for d in dirs if d not in IGNORED]
+        for name in files:
+            if not name.endswith(IGNORED):
+                yield pathlib.Path(root, name)
+
+
+def snapshot(paths: Iterable[pathlib.Path]) -> Snapshot:
+    mtimes = {}
+    for path in paths:
+        for file in _files(path):
+            try:
+                mtimes[file] = file.stat().st_mtime_ns
+            except FileNotFoundError:
+                pass
+
+    return mtimes
+
+
+def changed_files(before: Snapshot, after: Snapshot) -> set[pathlib.Path]:
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+def watch(
+    paths: list[pathlib.Path],
+    interval: float = 0.1,
+    debounce: float = 0.2,
+) -> Iterator[set[pathlib.Path]]:
+    """Yield the files that changed, once saves have been quiet for `debounce` seconds."""
+    current = snapshot(paths)
+    pending: set[pathlib.Path] = set()
+    last_change = 0.0
+
+    while True:
+        time.sleep(interval)
+
+        latest = snapshot(paths)
+        if changes := changed_files(current, latest):
+            pending |= changes
+            last_change = time.monotonic()
+            current = latest
+
+        if pending and time.monotonic() - last_change >= debounce:
+            yield pending
+            pending = set()
+
+
+def _run_in_group(target: Callable[[], None]) -> None:
+    # own process group so cancelling also stops the test case workers
+    os.setpgid(0, 0)
+    target()
+
+
+def start_run(target: Callable[[], None]) -> BaseProcess:
+    # fork keeps the already imported tools, only the solution gets re-imported
+    ctx = multiprocessing.get_context("fork")
+    process: BaseProcess = ctx.Process(target=_run_in_group, args=(target,))
+    process.start()
+
+    # both sides set the group, so it exists before cancel_run can be called whichever runs
+    # first, like start_new_session does for a subprocess
+    try:
+        os.setpgid(process.pid, process.pid)  # type: ignore[arg-type]
+    except ProcessLookupError:
+        # already finished
+        pass
+
+    return process
+
+
+def cancel_run(process: BaseProcess) -> bool:
+    if not process.is_alive():
+        process.join()
+        return False
+
+    try:
+        os.killpg(process.pid, signal.SIGKILL)  # type: ignore[arg-type]
+    except ProcessLookupError:
+        pass
+
+    process.join()
+    return True
@@ -0,0 +1,155 @@
+import multiprocessing
+import os
+import resource
+import time
+import traceback
+from multiprocessing.connection import Connection
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from typing import Any
+from typing import Callable
+from typing import cast
+from typing import Literal
+from typing import NamedTuple
+
+from tools.common import format_bytes
+
+Status = Literal["ok", "error", "timeout", "oom"]
+
+
+class Task(NamedTuple):
+    target: Callable[..., Any]
+    args: tuple[Any, ...]
+    timeout: float | None = None
+    memory_limit: int | None = None
+
+
+class Outcome(NamedTuple):
+    status: Status
+    result: Any
+    elapsed_ns: int
+    error: str = ""
+
+
+def _limit_memory(limit: int) -> None:
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _child(conn: Connection, task: Task) -> None:
+    start = time.perf_counter_ns()
+
+    try:
+        if task.memory_limit:
+            _limit_memory(task.memory_limit)
+
+        result = task.target(*task.args)
+        conn.send(Outcome("ok", result, time.perf_counter_ns() - start))
+    except MemoryError:
+        elapsed = time.perf_counter_ns() - start
+        error = f"Exceeded {format_bytes(task.memory_limit or 0)}"
+        conn.send(Outcome("oom", None, elapsed, error))
+    except BaseException as e:
+        error = "".join(traceback.format_exception(e)).strip()
+        conn.send(Outcome("error", None, time.perf_counter_ns() - start, error))
+    finally:
+        conn.close()
+
+
+def _collect(process: BaseProcess, conn: Connection, started: int) -> Outcome:
+    outcome: Outcome | None = None
+    try:
+        if conn.poll():
+            outcome = conn.recv()
+    except EOFError:
+        pass
+
+    process.join()
+    conn.close()
+
+    if outcome is None:
+        elapsed = time.perf_counter_ns() - started
+        return Outcome("error", None, elapsed, f"Process exited with code {process.exitcode}")
+
+    return outcome
+
+
+def _deadline(task: Task, started: int) -> float:
+    if task.timeout is None:
+        return float("inf")
+
+    return started + task.timeout * 1e9
+
+
+def run_concurrently(
+    tasks: list[Task],
+    workers: int | None = None,
+    on_done: Callable[[int, Outcome], None] | None = None,
+    on_started: Callable[[], None] | None = None,
+) -> list[Outcome]:
+    """Run each task in its own process, killing any that go over their time limit.
+
+    `on_started` is called once the last process has been forked, so it is safe for it to
+    start threads.
+    """
+    # fork lets the child run functions from solutions the parent loaded by path
+    ctx = multiprocessing.get_context("fork")
+    workers = workers or os.cpu_count() or 1
+    outcomes: list[Outcome | None] = [None] * len(tasks)
+
+    pending = list(enumerate(tasks))
+    running: dict[Connection, tuple[int, BaseProcess, int]] = {}
+
+    def finish(i: int, outcome: Outcome) -> None:
+        outcomes[i] = outcome
+        if on_done:
+            on_done(i, outcome)
+
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                i, task = pending.pop(0)
+                recv_conn, send_conn = ctx.Pipe(duplex=False)
+                process: BaseProcess = ctx.Process(
+                    target=_child, args=(send_conn, task), daemon=True
+                )
+                process.start()
+                send_conn.close()
+                running[recv_conn] = (i, process, time.perf_counter_ns())
+
+                if not pending and on_started:
+                    on_started()
+
+            now = time.perf_counter_ns()
+            deadline = min(_deadline(tasks[i], started) for i, _, started in running.values())
+            wait_for = None if deadline == float("inf") else max(0.0, (deadline - now) / 1e9)
+
+            for ready in wait(list(running), timeout=wait_for):
+                conn = cast(Connection, ready)
+                i, process, started = running.pop(conn)
+                finish(i, _collect(process, conn, started))
+
+            now = time.perf_counter_ns()
+            for conn, (i, process, started) in list(running.items()):
+                if now < _deadline(tasks[i], started):
+                    continue
+
+                process.kill()
+                process.join()
+                conn.close()
+                del running[conn]
+
+                error = f"Exceeded {tasks[i].timeout}s"
+                finish(i, Outcome("timeout", None, now - started, error))
+    finally:
+        for _, process, _ in running.values():
+            process.kill()
+
+    return [outcome for outcome in outcomes if outcome is not None]
+
+
+def run_in_subprocess(task: Task, on_started: Callable[[], None] | None = None) -> Outcome:
+    return run_concurrently([task], on_started=on_started)[0]